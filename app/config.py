@@ -9,3 +9,88 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(os.path.dirname(basedir), 'instance', 'app.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Seconds between checks of static/assets for added or renamed text-to-sign clips
+    TEXT_TO_SIGN_ASSET_CHECK_S = float(os.environ.get('TEXT_TO_SIGN_ASSET_CHECK_S', 2.0))
+    # Load the NLTK tagger and WordNet at startup, and memoize this many translated sentences
+    TEXT_TO_SIGN_WARMUP = os.environ.get('TEXT_TO_SIGN_WARMUP', '1') == '1'
+    TEXT_TO_SIGN_CACHE_SIZE = int(os.environ.get('TEXT_TO_SIGN_CACHE_SIZE', 1024))
+    TEXT_TO_SIGN_MAX_BATCH = int(os.environ.get('TEXT_TO_SIGN_MAX_BATCH', 1000))  # sentences per /api/translate call
+
+    # Load and warm up the sign-to-text models in the background at startup; otherwise on first use
+    SIGN_WARMUP = os.environ.get('SIGN_WARMUP', '1') == '1'
+
+    # Sign-to-text detector sessions (one per browser client)
+    SIGN_MAX_SESSIONS = int(os.environ.get('SIGN_MAX_SESSIONS', 32))
+    SIGN_SESSION_TTL = int(os.environ.get('SIGN_SESSION_TTL', 600))  # seconds idle before eviction
+
+    # 'camera' reads the server's webcam; 'browser' has clients upload frames to /sign_to_text/ingest
+    SIGN_FRAME_SOURCE = os.environ.get('SIGN_FRAME_SOURCE', 'camera')
+    SIGN_MAX_FRAME_BYTES = int(os.environ.get('SIGN_MAX_FRAME_BYTES', 2 * 1024 * 1024))
+    SIGN_MAX_FRAME_PIXELS = int(os.environ.get('SIGN_MAX_FRAME_PIXELS', 1920 * 1080))  # decoded width * height
+
+    # Model inference batching across sessions
+    SIGN_BATCH_MAX_SIZE = int(os.environ.get('SIGN_BATCH_MAX_SIZE', 8))
+    SIGN_BATCH_MAX_DELAY_MS = float(os.environ.get('SIGN_BATCH_MAX_DELAY_MS', 10))
+
+    # Inference backend: 'keras' (.h5) or 'tflite'; empty paths use the files in app/models
+    SIGN_MODEL_BACKEND = os.environ.get('SIGN_MODEL_BACKEND', 'keras')
+    SIGN_KERAS_MODEL = os.environ.get('SIGN_KERAS_MODEL', '')
+    SIGN_TFLITE_MODEL = os.environ.get('SIGN_TFLITE_MODEL', '')  # e.g. an int8-quantized export
+    SIGN_TFLITE_THREADS = int(os.environ.get('SIGN_TFLITE_THREADS', 0)) or None
+    SIGN_TFLITE_XNNPACK = os.environ.get('SIGN_TFLITE_XNNPACK', '1') == '1'
+
+    # Classifier: 'cnn' (keypoint canvas through the backend above) or 'landmarks' (NumPy MLP over landmark vectors)
+    SIGN_CLASSIFIER = os.environ.get('SIGN_CLASSIFIER', 'cnn')
+    SIGN_LANDMARK_MODEL = os.environ.get('SIGN_LANDMARK_MODEL', '')  # defaults to app/models/landmark_mlp.npz
+
+    # Live frame scheduling: full passes are spaced out once they exceed the budget, previews fill the gaps
+    SIGN_LATENCY_BUDGET_MS = float(os.environ.get('SIGN_LATENCY_BUDGET_MS', 80))
+    SIGN_MIN_FRAME_INTERVAL_MS = float(os.environ.get('SIGN_MIN_FRAME_INTERVAL_MS', 25))  # caps full passes at 40/s
+    SIGN_MAX_DETECTION_LOAD = float(os.environ.get('SIGN_MAX_DETECTION_LOAD', 0.5))
+
+    # Preview JPEG tiers (name -> (max width, quality)) picked by the client with ?preview=<name>, or 'none'
+    SIGN_PREVIEW_TIERS = {'low': (320, 60), 'medium': (480, 75), 'high': (640, 85)}
+    SIGN_PREVIEW_TIER = os.environ.get('SIGN_PREVIEW_TIER', 'high')
+    SIGN_PREVIEW_KEYFRAME_S = float(os.environ.get('SIGN_PREVIEW_KEYFRAME_S', 1.0))  # resend unchanged frames this often
+
+    # Smoothing of recognized symbols before they are committed: windowed 'vote' or 'ema'
+    SIGN_SMOOTHING_MODE = os.environ.get('SIGN_SMOOTHING_MODE', 'vote')
+    SIGN_SMOOTHING_WINDOW = int(os.environ.get('SIGN_SMOOTHING_WINDOW', 10))  # frames
+    SIGN_SMOOTHING_ALPHA = float(os.environ.get('SIGN_SMOOTHING_ALPHA', 0.5))  # EMA weight of the newest frame
+    SIGN_COMMIT_THRESHOLD = float(os.environ.get('SIGN_COMMIT_THRESHOLD', 0.5))  # share of the smoothed score
+    SIGN_COMMIT_GUARD_FRAMES = int(os.environ.get('SIGN_COMMIT_GUARD_FRAMES', 2))  # ignored transition frames
+    SIGN_AUTOCOMMIT_FRAMES = int(os.environ.get('SIGN_AUTOCOMMIT_FRAMES', 0))  # commit held letters without "next"; 0 = off
+
+    # Words whose dictionary suggestions are kept in memory
+    SIGN_SUGGESTION_CACHE_SIZE = int(os.environ.get('SIGN_SUGGESTION_CACHE_SIZE', 1024))
+
+    # Run hand detection and classification in worker processes, with frames passed through shared memory
+    # (live responses then trail by one frame: each request submits its frame and applies the previous one's result)
+    SIGN_PIPELINE = os.environ.get('SIGN_PIPELINE', '0') == '1'
+    SIGN_PIPELINE_SLOTS = int(os.environ.get('SIGN_PIPELINE_SLOTS', 8))  # frames in flight
+    SIGN_PIPELINE_DETECT_WORKERS = int(os.environ.get('SIGN_PIPELINE_DETECT_WORKERS', 1))
+
+    # Hands detected per frame; every hand is classified in one batched model call, the dominant one spells
+    SIGN_MAX_HANDS = int(os.environ.get('SIGN_MAX_HANDS', 1))
+    SIGN_DOMINANT_HAND = os.environ.get('SIGN_DOMINANT_HAND', 'Right')  # spells when both hands appear at once
+
+    # Track the hand region between full-frame searches (in-process detection only, not with SIGN_PIPELINE)
+    SIGN_HAND_TRACKING = os.environ.get('SIGN_HAND_TRACKING', '0') == '1'
+    SIGN_TRACKING_REDETECT_FRAMES = int(os.environ.get('SIGN_TRACKING_REDETECT_FRAMES', 10))  # full search at least this often
+    SIGN_TRACKING_MARGIN = float(os.environ.get('SIGN_TRACKING_MARGIN', 0.35))  # region padding per side, fraction of hand size
+
+    # Save each session's landmarks, probabilities and symbols under this directory for offline replay; empty = off
+    SIGN_RECORD_DIR = os.environ.get('SIGN_RECORD_DIR', '')
+
+    # Text-to-speech: sentences are rendered on a worker thread and the audio files cached by (text, voice, rate)
+    SIGN_TTS_CACHE_DIR = os.environ.get('SIGN_TTS_CACHE_DIR') or os.path.join(os.path.dirname(basedir), 'instance', 'tts_cache')
+    SIGN_TTS_CACHE_SIZE = int(os.environ.get('SIGN_TTS_CACHE_SIZE', 256))  # audio files kept
+    SIGN_TTS_VOICE = os.environ.get('SIGN_TTS_VOICE', '')  # pyttsx3 voice id; empty = first installed voice
+    SIGN_TTS_RATE = int(os.environ.get('SIGN_TTS_RATE', 150))  # words per minute
+
+    # Re-run hand detection on the canvas instead of mapping first-pass landmarks (slower; for comparison)
+    SIGN_SECOND_PASS = os.environ.get('SIGN_SECOND_PASS', '0') == '1'
+
+    # Per-stage latency histograms and frame counters served at /sign_to_text/metrics (Prometheus text format)
+    SIGN_METRICS_ENABLED = os.environ.get('SIGN_METRICS_ENABLED', '0') == '1'
@@ -0,0 +1,157 @@
+"""Offline sign-to-text transcription of recorded videos or frame directories.
+
+Usage:
+    python -m app.sign_to_text.batch INPUT [INPUT ...] [--output DIR] [--workers N | --pipeline] [--record DIR]
+
+Each INPUT is a video file or a directory of frame images (processed in
+name order). Frames are fed through the same detector pipeline as the live
+/video_feed route, as fast as the CPU allows. For every input a
+<name>.jsonl file with one record per frame is written to the output
+directory, and a summary with the final sentence and throughput is printed.
+
+--pipeline runs detection and classification in separate worker processes
+(see pipeline.py) and keeps several frames of each input in flight, so the
+stages overlap instead of running one after another.
+
+--record saves each input's landmarks, probabilities and symbols as
+DIR/<name>/ for replay without the models (see recording.py).
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import logging
+import os
+import time
+import cv2
+
+from app.sign_to_text.detector import DetectorResources, SignLanguageDetector, load_settings
+from app.sign_to_text.recording import LandmarkRecorder
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.webp')
+
+# One set of shared resources per process (main process or pool worker)
+_resources = None
+
+
+def _get_resources(pipeline=False):
+    global _resources
+    if _resources is None:
+        settings = load_settings()
+        settings['SIGN_PIPELINE'] = pipeline
+        _resources = DetectorResources(settings)
+    return _resources
+
+
+def iter_frames(path):
+    """Yield BGR frames from a video file or a directory of images."""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                frame = cv2.imread(os.path.join(path, name))
+                if frame is not None:
+                    yield frame
+        return
+
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise IOError(f"Could not open video: {path}")
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            yield frame
+    finally:
+        cap.release()
+
+
+def iter_results(detector, frames):
+    """process_image() over frames, with up to the pipeline's slot count in flight when it is enabled."""
+    pipeline = detector.resources.pipeline
+    if pipeline is None:
+        for frame in frames:
+            yield detector.process_image(frame, encode=False)
+        return
+
+    in_flight = deque()
+    for frame in frames:
+        if len(in_flight) == pipeline.slots:
+            yield detector.complete_image(*in_flight.popleft(), encode=False)
+        in_flight.append(detector.submit_image(frame))
+    while in_flight:
+        yield detector.complete_image(*in_flight.popleft(), encode=False)
+
+
+def transcribe(path, output_dir=None, pipeline=False, record_dir=None):
+    """Run one input through a fresh detector session; returns a summary dict."""
+    detector = SignLanguageDetector(_get_resources(pipeline))
+    name = os.path.splitext(os.path.basename(os.path.normpath(path)))[0]
+    if record_dir:
+        detector.recorder = LandmarkRecorder(os.path.join(record_dir, name), settings=detector.resources.smoothing)
+    out = open(os.path.join(output_dir, f"{name}.jsonl"), 'w') if output_dir else None
+
+    frames = 0
+    start = time.perf_counter()
+    try:
+        for index, result in enumerate(iter_results(detector, iter_frames(path))):
+            frames += 1
+            if out:
+                out.write(json.dumps({
+                    'frame': index,
+                    'hand': detector.hand_detected,
+                    'symbol': result['current_symbol'],
+                    'sentence': result['sentence'],
+                    'error': result['error'],
+                }) + '\n')
+    finally:
+        if out:
+            out.close()
+        detector.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'input': path,
+        'frames': frames,
+        'seconds': round(elapsed, 3),
+        'fps': round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+        'sentence': detector.str.strip(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transcribe recorded sign language videos to text")
+    parser.add_argument('inputs', nargs='+', help="Video files or directories of frame images")
+    parser.add_argument('--output', help="Directory for per-frame <name>.jsonl results")
+    parser.add_argument('--workers', type=int, default=1, help="Process pool size (one input per worker at a time)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="Overlap detection and classification of consecutive frames in worker processes")
+    parser.add_argument('--record', help="Directory to save per-frame landmark recordings in")
+    args = parser.parse_args(argv)
+    if args.pipeline and args.workers > 1:
+        parser.error("--pipeline and --workers are mutually exclusive")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            summaries = list(pool.map(transcribe, args.inputs, [args.output] * len(args.inputs),
+                                      [False] * len(args.inputs), [args.record] * len(args.inputs)))
+    else:
+        summaries = [transcribe(path, args.output, args.pipeline, args.record) for path in args.inputs]
+    elapsed = time.perf_counter() - start
+
+    for summary in summaries:
+        print(json.dumps(summary))
+    total = sum(summary['frames'] for summary in summaries)
+    logger.info(f"Processed {total} frames from {len(summaries)} inputs in {elapsed:.2f}s "
+                f"({total / elapsed if elapsed > 0 else 0:.1f} frames/sec)")
+
+
+if __name__ == '__main__':
+    main()
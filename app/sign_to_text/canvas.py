@@ -0,0 +1,88 @@
+"""The 400x400 white canvas the CNN classifies: the padded hand crop with its landmarks drawn on top.
+
+Kept free of session state so the same code runs in the request thread and
+in pipeline worker processes.
+"""
+import numpy as np
+import cv2
+
+CANVAS_SIZE = 400
+
+# Finger chains and palm edges drawn between landmarks
+FINGER_CONNECTIONS = [
+    (0, 1, 2, 3, 4),
+    (5, 6, 7, 8),
+    (9, 10, 11, 12),
+    (13, 14, 15, 16),
+    (17, 18, 19, 20)
+]
+PALM_CONNECTIONS = [
+    (5, 9), (9, 13), (13, 17),
+    (0, 5), (0, 17)
+]
+
+
+def hand_canvas(image, bbox, lm_list, offset=20, build_canvas=True):
+    """Crop the hand in bbox onto the canvas and map its landmarks there.
+
+    Returns (pts, white); both are None if the padded crop is degenerate, and
+    white is None when build_canvas is False (landmark-only classifiers).
+    """
+    x, y, w, h = map(int, bbox)
+
+    # Dynamic padding based on hand size
+    pad = max(20, int(min(w, h) * 0.2))
+
+    # Ensure valid image crop coordinates with padding
+    y1 = max(0, y - offset - pad)
+    y2 = min(image.shape[0], y + h + offset + pad)
+    x1 = max(0, x - offset - pad)
+    x2 = min(image.shape[1], x + w + offset + pad)
+    if not (x2 > x1 and y2 > y1 and (x2 - x1) > 20 and (y2 - y1) > 20):
+        return None, None
+
+    # Maintain aspect ratio while resizing
+    img_h, img_w = y2 - y1, x2 - x1
+    scale = 200.0 / max(img_h, img_w)
+    new_h, new_w = int(img_h * scale), int(img_w * scale)
+
+    # Center the image on the white canvas
+    start_y = (CANVAS_SIZE - new_h) // 2
+    start_x = (CANVAS_SIZE - new_w) // 2
+
+    white = None
+    if build_canvas:
+        white = np.full((CANVAS_SIZE, CANVAS_SIZE, 3), 255, dtype=np.uint8)
+        white[start_y:start_y+new_h, start_x:start_x+new_w] = cv2.resize(image[y1:y2, x1:x2], (new_w, new_h))
+
+    # Map the full-frame landmarks into canvas space by the crop/scale/offset transform
+    return map_to_canvas(lm_list, x1, y1, scale, start_x, start_y), white
+
+
+def map_to_canvas(lm_list, x1, y1, scale, start_x, start_y):
+    """Transform frame-space landmarks into the 400x400 canvas the crop was pasted on.
+
+    Only x and y move with the crop; z is MediaPipe's wrist-relative depth
+    and is passed through as detected.
+    """
+    mapped = np.array(lm_list, dtype=np.float32)
+    mapped[:, 0] = mapped[:, 0] * scale + start_x - x1 * scale
+    mapped[:, 1] = mapped[:, 1] * scale + start_y - y1 * scale
+    return np.rint(mapped).astype(int).tolist()
+
+
+def draw_keypoints(white, pts):
+    """Draw the hand skeleton (green) and keypoints (red) the CNN was trained on."""
+    for connection in FINGER_CONNECTIONS:
+        for t in range(len(connection) - 1):
+            pt1 = pts[connection[t]]
+            pt2 = pts[connection[t + 1]]
+            cv2.line(white, (pt1[0], pt1[1]), (pt2[0], pt2[1]), (0, 255, 0), 3)
+
+    for start, end in PALM_CONNECTIONS:
+        pt1 = pts[start]
+        pt2 = pts[end]
+        cv2.line(white, (pt1[0], pt1[1]), (pt2[0], pt2[1]), (0, 255, 0), 3)
+
+    for i in range(21):
+        cv2.circle(white, (pts[i][0], pts[i][1]), 2, (0, 0, 255), 1)
@@ -0,0 +1,100 @@
+import threading
+import logging
+import time
+import numpy as np
+import cv2
+
+logger = logging.getLogger(__name__)
+
+
+class FrameGrabber:
+    """Drains a cv2.VideoCapture on a background thread and keeps only the newest frame.
+
+    Exposes the subset of the VideoCapture interface used by the detector
+    (isOpened/read/release) so it can be used as a drop-in replacement.
+    """
+
+    def __init__(self, source=0, width=640, height=480, fps=30):
+        self.source = source
+        self.cap = cv2.VideoCapture(source)
+        if not self.cap.isOpened():
+            raise Exception("Could not open video capture device")
+
+        # Set camera properties for better performance
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+        # Keep the driver-side queue as short as the backend allows
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self.frame = None
+        self.seq = 0
+        self.frame_time = 0.0
+        self.running = True
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        failures = 0
+        try:
+            while self.running:
+                ret, frame = self.cap.read()
+                if not ret:
+                    failures += 1
+                    if failures % 30 == 1:
+                        logger.error("Failed to capture frame")
+                    time.sleep(0.01)
+                    continue
+                failures = 0
+                with self.cond:
+                    # Single slot: an unread frame is simply overwritten
+                    self.frame = frame
+                    self.seq += 1
+                    self.frame_time = time.time()
+                    self.cond.notify_all()
+        finally:
+            # Released here, never from another thread while read() may still be running
+            self.cap.release()
+            logger.info("Frame grabber stopped")
+
+    def isOpened(self):
+        return self.running and self.cap.isOpened()
+
+    def read(self):
+        """Return the newest frame without blocking on camera I/O."""
+        with self.cond:
+            if self.frame is None:
+                return False, None
+            return True, self.frame
+
+    def read_new(self, last_seq=0, timeout=0.1):
+        """Return (seq, frame) for a frame newer than last_seq, waiting up to timeout.
+
+        Falls back to the newest frame (possibly already seen) on timeout so
+        callers never block longer than one camera interval.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > last_seq or not self.running, timeout)
+            return self.seq, self.frame
+
+    def release(self):
+        self.running = False
+        with self.cond:
+            self.cond.notify_all()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+            if self.thread.is_alive():
+                logger.warning("Frame grabber still inside a camera read; it releases the device once the read returns")
+
+
+def decode_frame(data):
+    """Decode a compressed (JPEG/PNG/WebP) frame uploaded by the browser.
+
+    np.frombuffer wraps the request bytes without copying them, so the only
+    allocation is the decoded BGR image itself. Returns None if undecodable.
+    """
+    if not data:
+        return None
+    buf = np.frombuffer(data, dtype=np.uint8)
+    return cv2.imdecode(buf, cv2.IMREAD_COLOR)
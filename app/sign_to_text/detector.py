@@ -0,0 +1,860 @@
+# Importing Libraries
+import os
+os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # Reduce TensorFlow logging
+
+import base64
+from contextlib import nullcontext
+import numpy as np
+import cv2
+from cvzone.HandTrackingModule import HandDetector
+from app.config import Config
+from app.sign_to_text.capture import FrameGrabber
+from app.sign_to_text.inference import BatchScheduler, load_backend, MODELS_DIR
+from app.sign_to_text.landmarks import LandmarkClassifier, landmark_features
+from app.sign_to_text.metrics import Metrics
+from app.sign_to_text.rules import classify_symbol, top_groups
+from app.sign_to_text.scheduler import FrameScheduler, FULL, PREVIEW
+from app.sign_to_text.preview import PreviewEncoder
+from app.sign_to_text.canvas import hand_canvas, draw_keypoints
+from app.sign_to_text.smoothing import SymbolSmoother
+from app.sign_to_text.tracking import HandTracker, ROI_SIZE
+from app.sign_to_text.pipeline import PipelineExecutor, Observation, NO_HAND
+from app.sign_to_text.suggestions import SuggestionService
+from app.sign_to_text.recording import LandmarkRecorder
+from app.sign_to_text.hands import HandState, label_hands
+import enchant
+import threading
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a free pipeline slot, and then for the frame's result, before giving up on it
+PIPELINE_TIMEOUT = 5.0
+# Pipeline workers load their models before the first result, so warm-up waits longer
+WARMUP_TIMEOUT = 120.0
+
+
+def load_settings(config_class=Config):
+    """Upper-case settings of a config class as a dict, for use outside a Flask app context."""
+    return {key: getattr(config_class, key) for key in dir(config_class) if key.isupper()}
+
+
+class DetectorResources:
+    """Heavyweight objects shared by every detector session in the process.
+
+    MediaPipe graphs are not safe to call concurrently, so callers hold
+    inference_lock around hand detection; model calls go through the batch
+    scheduler, which owns the inference backend. With SIGN_PIPELINE, both
+    run in worker processes instead and are not loaded here.
+    """
+
+    def __init__(self, config, metrics=None):
+        try:
+            logger.info("Loading model...")
+
+            # Per-stage latency histograms and frame counters, exposed on /metrics
+            self.metrics = metrics or Metrics(enabled=config['SIGN_METRICS_ENABLED'])
+
+            # 'cnn' classifies the 400x400 keypoint canvas; 'landmarks' uses the landmark vector directly
+            self.classifier = config['SIGN_CLASSIFIER']
+            if self.classifier not in ('cnn', 'landmarks'):
+                raise ValueError(f"Unknown classifier: {self.classifier}")
+
+            # Detection and classification in worker processes (see pipeline.py)
+            self.pipeline = None
+            if config['SIGN_PIPELINE']:
+                self.pipeline = PipelineExecutor(config, metrics=self.metrics,
+                                                 slots=config['SIGN_PIPELINE_SLOTS'],
+                                                 detect_workers=config['SIGN_PIPELINE_DETECT_WORKERS'],
+                                                 max_batch=config['SIGN_BATCH_MAX_SIZE'])
+                if config['SIGN_SECOND_PASS']:
+                    logger.warning("SIGN_SECOND_PASS is ignored when SIGN_PIPELINE is enabled")
+                if config['SIGN_MAX_HANDS'] > 1:
+                    logger.warning("SIGN_MAX_HANDS is ignored when SIGN_PIPELINE is enabled")
+
+            self.landmark_model = None
+            self.backend = None
+            if self.pipeline is None and self.classifier == 'landmarks':
+                self.landmark_model = LandmarkClassifier(
+                    config['SIGN_LANDMARK_MODEL'] or os.path.join(MODELS_DIR, 'landmark_mlp.npz'))
+            elif self.pipeline is None:
+                # Load the configured inference backend (Keras .h5 or TFLite)
+                self.backend = load_backend(config)
+            
+            # Initialize hand detectors with optimized parameters
+            self.hd = None
+            self.hd2 = None
+            self.hd_roi = None
+            self.hand_tracking = False
+            self.second_pass = False
+            if self.pipeline is None:
+                try:
+                    # Uploaded frames from different clients interleave through the shared graph, so
+                    # MediaPipe must not carry landmarks over from the previous (someone else's) frame
+                    static = config['SIGN_FRAME_SOURCE'] == 'browser'
+                    # One palm-detection pass finds every hand; only the landmark model runs per hand
+                    self.hd = HandDetector(staticMode=static, maxHands=config['SIGN_MAX_HANDS'], detectionCon=0.7)
+                    # Resampled hand regions go through a separate graph (see roi_detector()), so
+                    # tracking state never mixes region and full-frame coordinates
+                    if config['SIGN_HAND_TRACKING'] and config['SIGN_MAX_HANDS'] > 1:
+                        logger.warning("SIGN_HAND_TRACKING only follows a single hand and is off with SIGN_MAX_HANDS > 1")
+                    elif config['SIGN_HAND_TRACKING']:
+                        self.hand_tracking = True
+                        if static:
+                            # Shared by all sessions, whose regions interleave through it
+                            self.hd_roi = HandDetector(staticMode=True, maxHands=1, detectionCon=0.7)
+                    # Canvas landmarks are normally mapped from the first pass; the second
+                    # MediaPipe pass is only kept for accuracy comparison
+                    self.second_pass = config['SIGN_SECOND_PASS']
+                    self.hd2 = HandDetector(maxHands=1, detectionCon=0.7) if self.second_pass else None
+                except Exception as e:
+                    logger.error(f"Failed to initialize hand detectors: {str(e)}")
+                    raise
+            
+            # Initialize dictionary
+            try:
+                self.dictionary = enchant.Dict("en-US")
+            except Exception as e:
+                logger.error(f"Failed to initialize dictionary: {str(e)}")
+                raise
+
+            # Model calls from all sessions are coalesced into batches on one worker thread
+            self.scheduler = None
+            if self.backend is not None:
+                self.scheduler = BatchScheduler(self.backend.predict,
+                                                max_batch=config['SIGN_BATCH_MAX_SIZE'],
+                                                max_delay=config['SIGN_BATCH_MAX_DELAY_MS'] / 1000.0)
+
+            self._configure_sessions(config)
+            if self.pipeline is not None:
+                self.max_hands = 1
+
+            self.inference_lock = threading.Lock()
+            self.dictionary_lock = threading.Lock()
+
+            # Memoized word suggestions, computed on a worker thread
+            self.suggestions = SuggestionService(self.dictionary, lock=self.dictionary_lock,
+                                                 cache_size=config['SIGN_SUGGESTION_CACHE_SIZE'])
+
+            # Camera is opened on demand and shared by all sessions reading from it
+            self.vs = None
+            self.camera_users = set()
+            self.camera_lock = threading.Lock()
+            logger.info("Detector resources initialized successfully")
+        except Exception as e:
+            logger.error(f"Error initializing detector resources: {str(e)}")
+            raise
+
+    def _configure_sessions(self, config):
+        """Settings every detector session reads from its resources."""
+        # Per-session frame scheduling (see scheduler.py)
+        self.latency_budget = config['SIGN_LATENCY_BUDGET_MS'] / 1000.0
+        self.min_frame_interval = config['SIGN_MIN_FRAME_INTERVAL_MS'] / 1000.0
+        self.max_detection_load = config['SIGN_MAX_DETECTION_LOAD']
+
+        # Hand region tracking (see tracking.py)
+        self.tracking = {
+            'redetect_every': config['SIGN_TRACKING_REDETECT_FRAMES'],
+            'margin': config['SIGN_TRACKING_MARGIN'],
+        }
+
+        # Symbol smoothing before commit (see smoothing.py)
+        self.smoothing = {
+            'mode': config['SIGN_SMOOTHING_MODE'],
+            'window': config['SIGN_SMOOTHING_WINDOW'],
+            'alpha': config['SIGN_SMOOTHING_ALPHA'],
+            'threshold': config['SIGN_COMMIT_THRESHOLD'],
+            'guard': config['SIGN_COMMIT_GUARD_FRAMES'],
+            'hold': config['SIGN_AUTOCOMMIT_FRAMES'],
+        }
+
+        # Preview JPEG tiers clients can choose from (name -> (max width, quality))
+        self.preview_tiers = config['SIGN_PREVIEW_TIERS']
+        self.preview_tier = config['SIGN_PREVIEW_TIER']
+        self.preview_keyframe_interval = config['SIGN_PREVIEW_KEYFRAME_S']
+
+        # Hands recognized per frame (see hands.py)
+        self.max_hands = config['SIGN_MAX_HANDS']
+        self.dominant_hand = config['SIGN_DOMINANT_HAND']
+
+        # Directory for per-session landmark recordings (see recording.py); empty disables
+        self.record_dir = config['SIGN_RECORD_DIR']
+
+    def warm_up(self):
+        """Push a blank frame through every loaded model so graph setup is paid before real traffic."""
+        start = time.perf_counter()
+        blank = np.zeros((480, 640, 3), dtype=np.uint8)
+        if self.hd is not None:
+            with self.inference_lock:
+                self.hd.findHands(blank, draw=False, flipType=True)
+        if self.hd_roi is not None:
+            with self.inference_lock:
+                self.hd_roi.findHands(blank[:ROI_SIZE, :ROI_SIZE], draw=False, flipType=True)
+        if self.hd2 is not None:
+            with self.inference_lock:
+                self.hd2.findHands(np.full((400, 400, 3), 255, dtype=np.uint8), draw=False, flipType=True)
+        if self.backend is not None:
+            self.backend.predict(np.full((1, 400, 400, 3), 255, dtype=np.uint8))
+        if self.pipeline is not None:
+            # Spawns the workers, which warm up their own models before taking frames
+            self.pipeline.submit(blank).result(timeout=WARMUP_TIMEOUT)
+        self.suggestions.suggest("HELLO")
+        logger.info(f"Detector warm-up finished in {time.perf_counter() - start:.2f}s")
+
+    def roi_detector(self):
+        """Hand detector for one session's tracked regions.
+
+        Uploaded frames share the static graph in hd_roi. Camera sessions get
+        their own video-mode graph, which follows the hand from one region to
+        the next instead of running palm detection on every crop.
+        """
+        if self.hd_roi is not None:
+            return self.hd_roi
+        return HandDetector(staticMode=False, maxHands=1, detectionCon=0.7)
+
+    @property
+    def uses_canvas(self):
+        """Whether the classifier needs the keypoint-annotated white canvas."""
+        return self.classifier == 'cnn'
+
+    def classify(self, white, pts, key=None):
+        """Gesture-group probabilities for one hand, from its canvas (CNN) or its landmarks."""
+        if self.classifier == 'landmarks':
+            return self.landmark_model.predict(landmark_features(pts))[0]
+        return self.scheduler.predict(white, key=key)
+
+    def classify_many(self, whites, pts_list, key=None):
+        """(n, groups) probabilities for several hands of one frame, in a single model call."""
+        if self.classifier == 'landmarks':
+            return self.landmark_model.predict_landmarks(pts_list)
+        return self.scheduler.submit_many(whites, key=key).result()
+
+    def acquire_camera(self, owner):
+        """Return the shared frame grabber, (re)opening the camera if needed."""
+        with self.camera_lock:
+            if self.vs is None or not self.vs.isOpened():
+                self.vs = FrameGrabber(0)
+            self.camera_users.add(owner)
+            return self.vs
+
+    def release_camera(self, owner):
+        """Drop owner's claim on the camera and release it once nobody is using it."""
+        with self.camera_lock:
+            self.camera_users.discard(owner)
+            if not self.camera_users and self.vs is not None:
+                self.vs.release()
+                self.vs = None
+                logger.info("Camera released")
+
+
+class ReplayResources(DetectorResources):
+    """Model-free stand-in for DetectorResources, for replaying recorded observations (see recording.py).
+
+    Sessions built on it only run the rules, smoothing and sentence logic;
+    no camera, hand detector, model or dictionary is loaded.
+    """
+
+    def __init__(self, config, smoothing=None):
+        self.metrics = Metrics(enabled=False)
+        self.classifier = config['SIGN_CLASSIFIER']
+        self.pipeline = None
+        self.landmark_model = None
+        self.backend = None
+        self.scheduler = None
+        self.hd = self.hd2 = self.hd_roi = None
+        self.hand_tracking = False
+        self.second_pass = False
+        self._configure_sessions(config)
+        if smoothing:
+            # Replay with the settings the recording was made with
+            self.smoothing = dict(smoothing)
+        self.record_dir = ''
+        self.inference_lock = threading.Lock()
+        self.dictionary_lock = threading.Lock()
+        self.suggestions = _NoSuggestions()
+        self.vs = None
+        self.camera_users = set()
+        self.camera_lock = threading.Lock()
+
+
+class _NoSuggestions:
+    def lookup(self, word, callback):
+        return None
+
+    def suggest(self, word):
+        return (" ", " ", " ", " ")
+
+
+class DetectorUnavailable(Exception):
+    """Raised while the shared detector resources are not loaded or failed to load."""
+
+
+class ResourceLoader:
+    """Builds DetectorResources on first use, or ahead of time on a background warm-up thread.
+
+    Importing the blueprint stays cheap, and a failed load is reported
+    (and retried on the next use) instead of taking the process down.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        # Created up front so /metrics works before the models are loaded
+        self.metrics = Metrics(enabled=config['SIGN_METRICS_ENABLED'])
+        self.resources = None
+        self.state = 'cold'  # cold -> loading -> ready, or failed
+        self.error = None
+        self.lock = threading.Lock()
+
+    @property
+    def ready(self):
+        return self.state == 'ready'
+
+    def get(self):
+        """The loaded resources, loading and warming them up first if needed."""
+        resources = self.resources
+        if resources is not None:
+            return resources
+        with self.lock:
+            if self.resources is None:
+                self.state = 'loading'
+                try:
+                    resources = DetectorResources(self.config, metrics=self.metrics)
+                    resources.warm_up()
+                except Exception as e:
+                    logger.error(f"Failed to initialize detector: {str(e)}")
+                    self.state, self.error = 'failed', str(e)
+                    raise DetectorUnavailable(f"Sign detector unavailable: {str(e)}") from e
+                self.resources = resources
+                self.state, self.error = 'ready', None
+            return self.resources
+
+    def warm_up_in_background(self):
+        def run():
+            try:
+                self.get()
+            except DetectorUnavailable:
+                pass  # Already logged; the next request retries
+        threading.Thread(target=run, name='sign-detector-warmup', daemon=True).start()
+
+
+class SignLanguageDetector:
+    """Per-client recognition state; heavyweight objects live in DetectorResources."""
+
+    def __init__(self, resources):
+        self.resources = resources
+        # Serializes requests that belong to the same session
+        self.lock = threading.RLock()
+        self.vs = None
+        self.last_seq = 0
+        # (frame, Future) submitted to the pipeline whose result the next live frame applies
+        self.in_flight = None
+        # Set once the session manager has evicted this session; its streams then end
+        self.closed = False
+            
+        # Initialize other variables
+        self.prev_char = ""
+        # Recent symbols, smoothed before one is committed to the sentence
+        self.smoother = SymbolSmoother(**resources.smoothing)
+        # Region-of-interest tracking between full-frame hand searches
+        self.tracker = None
+        if resources.hand_tracking:
+            self.tracker = HandTracker(**resources.tracking)
+            self.hd_roi = resources.roi_detector()
+            # Only the shared graph needs the inference lock; the session lock already serializes its own
+            self.roi_lock = resources.inference_lock if self.hd_roi is resources.hd_roi else nullcontext()
+            if self.hd_roi is not resources.hd_roi:
+                # Pay graph setup here, outside the frame loop
+                self.hd_roi.findHands(np.zeros((ROI_SIZE, ROI_SIZE, 3), dtype=np.uint8), draw=False, flipType=True)
+        self.frame_interval = 1.0 / 30
+        # Decides per frame between a full pass, a preview only, or the previous result
+        self.frame_scheduler = FrameScheduler(budget=resources.latency_budget,
+                                              min_interval=resources.min_frame_interval,
+                                              max_load=resources.max_detection_load)
+        self.preview = PreviewEncoder(resources.preview_tiers, resources.preview_tier,
+                                      keyframe_interval=resources.preview_keyframe_interval)
+        self.current_word = ""
+        self.hand_detected = False
+        # Last box of each visible hand by label, the hand spelling the sentence,
+        # and the recognition state of the other hands
+        self.hand_boxes = {}
+        self.primary_side = None
+        self.other_hands = {}
+            
+        self.str = " "
+        self.word = " "
+        self.current_symbol = "Empty"
+        self.word1 = " "
+        self.word2 = " "
+        self.word3 = " "
+        self.word4 = " "
+        # Word whose suggestions are being looked up; later frames of it do not ask again
+        self.suggesting = None
+        
+        self.offset = 20
+
+        # Recognition state shared with event-stream listeners
+        self.state = None
+        self.state_version = 0
+        self.state_cond = threading.Condition()
+
+        # Per-frame observations and outcomes, saved on close() for offline replay
+        self.recorder = None
+        if resources.record_dir:
+            path = os.path.join(resources.record_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{id(self):x}")
+            self.recorder = LandmarkRecorder(path, settings=resources.smoothing)
+
+    def _get_error_response(self, error_message):
+        """Helper method to generate error response"""
+        return {
+            'error': error_message,
+            'main_frame': None,
+            'current_symbol': '-',
+            'sentence': self.str,
+            'suggestions': [self.word1, self.word2, self.word3, self.word4]
+        }
+    
+    def release_camera(self):
+        """Give up this session's claim on the shared camera."""
+        self.resources.release_camera(self)
+        self.vs = None
+
+    def close(self):
+        """Called by the session manager when this session is evicted."""
+        self.release_camera()
+        if self.tracker is not None and self.hd_roi is not self.resources.hd_roi:
+            self.hd_roi.hands.close()
+        if self.in_flight is not None:
+            self.in_flight[1].cancel()
+            self.in_flight = None
+        if self.recorder is not None:
+            try:
+                self.recorder.close()
+            except Exception as e:
+                logger.error(f"Error saving landmark recording: {str(e)}")
+            self.recorder = None
+        with self.state_cond:
+            self.closed = True
+            self.state_cond.notify_all()
+
+    def get_state(self):
+        """Recognition fields pushed to clients alongside the video preview."""
+        return {
+            'current_symbol': self.current_symbol,
+            'sentence': self.str,
+            'suggestions': [self.word1, self.word2, self.word3, self.word4],
+            'other_hands': {side: hand.symbol for side, hand in self.other_hands.items()}
+        }
+
+    def _publish_state(self):
+        """Wake up event-stream listeners if the recognition fields changed."""
+        state = self.get_state()
+        with self.state_cond:
+            if state != self.state:
+                self.state = state
+                self.state_version += 1
+                self.state_cond.notify_all()
+
+    def wait_for_state(self, last_version, timeout=15.0):
+        """Block until the state version moves past last_version; returns (version, state or None).
+
+        Also returns (last_version, None) as soon as the session is closed.
+        """
+        with self.state_cond:
+            self.state_cond.wait_for(lambda: self.state_version != last_version or self.closed, timeout)
+            if self.state_version == last_version:
+                return last_version, None
+            return self.state_version, self.state
+
+    def get_frame(self, since=None):
+        """Get a frame from the camera and process it for prediction (base64 JSON payload).
+
+        Clients pass back the last 'version' they saw as since; if the recognition
+        fields have not changed since then they are omitted and 'unchanged' is set.
+        """
+        version = self.state_version
+        frame_data = self.process_frame()
+        if not frame_data:
+            return frame_data
+        if frame_data['main_frame'] is not None:
+            frame_data['main_frame'] = base64.b64encode(frame_data['main_frame']).decode('ascii')
+        return self.delta_response(frame_data, version, since)
+
+    def delta_response(self, frame_data, version, since):
+        """Drop the recognition fields from frame_data if the client already has state version."""
+        frame_data['version'] = version
+        if since is not None and since == version and frame_data['error'] is None:
+            for key in self.get_state():
+                frame_data.pop(key, None)
+            frame_data['unchanged'] = True
+        return frame_data
+
+    def process_frame(self):
+        """Get a frame from the camera and process it; main_frame holds raw JPEG bytes."""
+        try:
+            # Open (or reopen) the shared camera on demand
+            try:
+                vs = self.resources.acquire_camera(self)
+            except Exception:
+                logger.error("Could not open video capture device")
+                return None
+            if vs is not self.vs:
+                self.vs = vs
+                self.last_seq = 0
+                    
+            # Only ever pick the newest frame; never wait on camera I/O longer than one interval
+            with self.resources.metrics.stage('capture'):
+                seq, frame = self.vs.read_new(self.last_seq, timeout=self.frame_interval)
+            if frame is None:
+                logger.error("Failed to capture frame")
+                self.resources.metrics.count('failed')
+                return None
+            if seq == self.last_seq:
+                self.resources.metrics.count('skipped')
+                return self._get_error_response("Frame skipped")
+            self.last_seq = seq
+
+            return self.process_scheduled(frame)
+
+        except Exception as e:
+            logger.error(f"Error in process_frame: {str(e)}")
+            self.resources.metrics.count('failed')
+            return self._get_error_response(f"Internal error: {str(e)}")
+
+    def process_scheduled(self, frame, encode=True):
+        """Process a live frame as the frame scheduler decides, within the latency budget.
+
+        Full passes run hand detection and classification; otherwise only the
+        preview is refreshed (or, when even that is over budget, skipped) and
+        the previous recognition result is returned.
+        """
+        encode = encode and self.preview.enabled
+        mode = self.frame_scheduler.decide()
+        start = time.perf_counter()
+        if mode == FULL:
+            result = self.process_image(frame, encode)
+        elif mode == PREVIEW and encode:
+            result = self.process_preview(frame)
+        else:
+            self.resources.metrics.count('reused')
+            return {'error': None, 'main_frame': None, **self.get_state()}
+        self.frame_scheduler.record(mode, time.perf_counter() - start)
+        return result
+
+    def process_preview(self, frame):
+        """Flip, resize and encode a frame for display, keeping the last recognition result."""
+        metrics = self.resources.metrics
+        try:
+            cv2image = self._flip_resize(frame, metrics)
+            with metrics.stage('encode'):
+                main_frame = self.preview.encode(cv2image)
+            metrics.count('preview')
+            return {'error': None, 'main_frame': main_frame, **self.get_state()}
+        except Exception as e:
+            logger.error(f"Error in process_preview: {str(e)}")
+            metrics.count('failed')
+            return self._get_error_response("Failed to encode video frame")
+
+    def _flip_resize(self, frame, metrics):
+        with metrics.stage('flip_resize'):
+            cv2image = cv2.flip(frame, 1)
+            
+            # Maintain aspect ratio while resizing
+            height, width = cv2image.shape[:2]
+            target_width = 640
+            target_height = int(target_width * height / width)
+            return cv2.resize(cv2image, (target_width, target_height))
+
+    def process_image(self, frame, encode=True):
+        """Run one BGR frame (camera or browser upload) through the crop/predict path.
+
+        With encode=False the preview is not JPEG-encoded and main_frame is None,
+        for clients that render their own camera feed. main_frame is also None
+        when the frame looks unchanged from the last one sent.
+
+        With the pipeline, the response is for the previous frame of this
+        session: frame N is detected and classified while the caller fetches,
+        sends or displays the result of frame N-1.
+        """
+        metrics = self.resources.metrics
+        try:
+            with metrics.stage('frame'):
+                cv2image = self._flip_resize(frame, metrics)
+                if self.resources.pipeline is not None:
+                    return self._process_pipelined(cv2image, encode, metrics)
+                observation = self._observe(cv2image, metrics)
+                return self._apply(cv2image, observation, encode, metrics)
+        except Exception as e:
+            logger.error(f"Error in process_image: {str(e)}")
+            metrics.count('failed')
+            return self._get_error_response(f"Internal error: {str(e)}")
+
+    def _process_pipelined(self, cv2image, encode, metrics):
+        """Submit this frame and apply the one submitted before it (one frame in flight per session)."""
+        future = self.resources.pipeline.submit(cv2image, timeout=PIPELINE_TIMEOUT)
+        previous, self.in_flight = self.in_flight, (cv2image, future)
+        if previous is None:
+            # First frame of the session: nothing to show yet
+            return {'error': None, 'main_frame': None, **self.get_state()}
+        cv2image, future = previous
+        return self._apply(cv2image, self._result(future), encode, metrics)
+
+    @staticmethod
+    def _result(future):
+        try:
+            return future.result(timeout=PIPELINE_TIMEOUT)
+        except Exception:
+            # Nobody waits for it any more; the pipeline frees its slot when the workers are done
+            future.cancel()
+            raise
+
+    def submit_image(self, frame):
+        """Start detection/classification of frame on the pipeline; pass the result to complete_image().
+
+        Lets offline callers keep several frames in flight, applying results in order.
+        """
+        cv2image = self._flip_resize(frame, self.resources.metrics)
+        return cv2image, self.resources.pipeline.submit(cv2image, timeout=PIPELINE_TIMEOUT)
+
+    def complete_image(self, cv2image, future, encode=True):
+        """Apply a result from submit_image(); same response as process_image()."""
+        metrics = self.resources.metrics
+        try:
+            return self._apply(cv2image, self._result(future), encode, metrics)
+        except Exception as e:
+            logger.error(f"Error in complete_image: {str(e)}")
+            metrics.count('failed')
+            return self._get_error_response(f"Internal error: {str(e)}")
+
+    def _observe(self, cv2image, metrics):
+        """Detect the hands, build their canvases and classify them in this thread (None if that failed).
+
+        Returns the Observation of the hand spelling the sentence; further hands are in its others.
+        """
+        # Use a copy for processing to avoid modifying the display frame
+        cv2image_copy = np.array(cv2image)
+            
+        hands = self._find_hands(cv2image_copy, metrics)
+        if not hands:
+            self.hand_boxes = {}
+            self.primary_side = None
+            return NO_HAND
+
+        try:
+            sides = label_hands(hands, self.hand_boxes)
+            self.hand_boxes = {side: hand['bbox'] for side, hand in zip(sides, hands)}
+
+            observations = []
+            whites = []
+            for hand, side in zip(hands, sides):
+                # The landmark classifier never looks at the canvas, so only build it when needed
+                with metrics.stage('crop_canvas'):
+                    pts, white = hand_canvas(cv2image_copy, hand['bbox'], hand['lmList'], self.offset,
+                                             build_canvas=self.resources.uses_canvas or self.resources.second_pass)
+
+                if pts is not None and self.resources.second_pass:
+                    # Opt-in: detect again on the canvas and report how far the mapping is off
+                    with metrics.stage('second_detect'), self.resources.inference_lock:
+                        handz = self.resources.hd2.findHands(white, draw=False, flipType=True)
+                    if handz and handz[0]:
+                        detected = handz[0][0]['lmList']
+                        error = np.abs(np.asarray(detected)[:, :2] - np.asarray(pts)[:, :2]).mean()
+                        logger.debug(f"Second pass landmark deviation: {error:.1f}px")
+                        pts = detected
+                    else:
+                        pts = None
+
+                if pts is not None and self.resources.uses_canvas:
+                    with metrics.stage('draw_keypoints'):
+                        draw_keypoints(white, pts)
+                observations.append(Observation(True, pts, None, hand['bbox'], side))
+                whites.append(white)
+
+            valid = [i for i, observation in enumerate(observations) if observation.pts is not None]
+            if valid:
+                # All hands of the frame go through one model call, itself batched with
+                # concurrent sessions by the shared scheduler
+                with metrics.stage('classify'):
+                    probs = self.resources.classify_many([whites[i] for i in valid],
+                                                         [observations[i].pts for i in valid], key=id(self))
+                for i, prob in zip(valid, probs):
+                    observations[i] = observations[i]._replace(prob=prob)
+
+            primary = self._primary_hand(sides)
+            others = tuple(observation for i, observation in enumerate(observations) if i != primary)
+            return observations[primary]._replace(others=others)
+        except Exception as e:
+            logger.error(f"Error processing hand: {str(e)}")
+            metrics.count('failed')
+            return None
+
+    def _primary_hand(self, sides):
+        """Index of the hand that spells: the same hand as before if still visible, else the dominant one."""
+        for side in (self.primary_side, self.resources.dominant_hand):
+            if side in sides:
+                self.primary_side = side
+                return sides.index(side)
+        self.primary_side = sides[0]
+        return 0
+
+    def _find_hands(self, image, metrics):
+        """Detected hands (lmList/bbox/type dicts), at most max_hands; searches only the tracked region when possible."""
+        tracker = self.tracker
+        if tracker is not None:
+            roi = tracker.predict_roi(image.shape)
+            if roi is not None:
+                with metrics.stage('detect_roi'), self.roi_lock:
+                    hand = tracker.detect(self.hd_roi, image, roi)
+                if hand is not None:
+                    tracker.update(hand['bbox'], full=False)
+                    return [hand]
+                # Lost or unsure: fall back to a full-frame search right away
+                metrics.count('tracking_lost')
+                tracker.lost()
+
+        # Find hands with increased detection confidence
+        with metrics.stage('detect_hands'), self.resources.inference_lock:
+            hands = self.resources.hd.findHands(image, draw=False, flipType=True)
+        if not (hands and hands[0]):
+            if tracker is not None:
+                tracker.lost()
+            return []
+        hands = hands[0][:self.resources.max_hands]
+        if tracker is not None:
+            tracker.update(hands[0]['bbox'], full=True)
+        return hands
+
+    def _apply(self, cv2image, observation, encode, metrics):
+        """Update the sentence state from one observation and build the response."""
+        self._update(observation, metrics)
+        if self.recorder is not None:
+            self.recorder.add(observation, self.current_symbol, self.str)
+
+        self._publish_state()
+        metrics.count('processed')
+
+        if not encode:
+            return {'error': None, 'main_frame': None, **self.get_state()}
+        
+        # Encode the main frame as JPEG at the session's preview tier (None if unchanged)
+        try:
+            with metrics.stage('encode'):
+                main_frame = self.preview.encode(cv2image)
+        except Exception as e:
+            logger.error(f"Error encoding main frame: {str(e)}")
+            metrics.count('failed')
+            return self._get_error_response("Failed to encode video frame")
+
+        # Return the response with all required fields
+        return {
+            'error': None,
+            'main_frame': main_frame,
+            **self.get_state()
+        }
+
+    def _update(self, observation, metrics):
+        """Sentence state after one observation; everything downstream of the models (replayable)."""
+        # Reset hand detection flag
+        was_hand_detected = self.hand_detected
+        self.hand_detected = observation is not None and observation.hand
+        
+        # Process hand if detected
+        if observation is None:
+            # Hand processing failed; leave the sentence as it is
+            pass
+        elif observation.hand:
+            if observation.pts is not None:
+                try:
+                    self.pts = observation.pts
+                    self.predict(observation.prob)
+                    
+                    words = self.str.strip().split()
+                    self.current_word = words[-1] if words else ""
+                except Exception as e:
+                    logger.error(f"Error processing hand: {str(e)}")
+                    metrics.count('failed')
+                    self.hand_detected = False
+        else:
+            metrics.count('no_hand')
+            # Add space only if we have a valid character
+            if was_hand_detected and self.current_symbol != "Empty" and not self.str.endswith(" "):
+                self.str += " "
+                self.current_symbol = "Empty"
+                # The next word starts from a clean history
+                self.smoother.reset()
+
+        if observation is not None:
+            self._update_other_hands(observation.others)
+
+    def _update_other_hands(self, others):
+        """Smoothed symbols of the visible hands that are not spelling; state of vanished hands is dropped."""
+        visible = set()
+        for other in others:
+            visible.add(other.side)
+            if other.pts is None:
+                continue
+            hand = self.other_hands.get(other.side)
+            if hand is None:
+                hand = self.other_hands[other.side] = HandState(other.side, self.resources.smoothing)
+            hand.update(other.prob, other.pts)
+        for side in list(self.other_hands):
+            if side not in visible:
+                del self.other_hands[side]
+
+    def predict(self, prob):
+        """Turn gesture-group probabilities for self.pts into a symbol and update the sentence."""
+        metrics = self.resources.metrics
+        ch1, ch2, confidence = top_groups(prob)
+
+        # Group refinement, letter split and control gestures (see rules.py)
+        with metrics.stage('rules'):
+            ch1 = classify_symbol(ch1, ch2, self.pts)
+
+
+        if ch1=="next" and self.prev_char!="next":
+            # Commit what was signed before "next", smoothed over the recent frames
+            committed = self.smoother.best(exclude=("next",))
+            if committed=="Backspace":
+                self.str=self.str[0:-1]
+            elif committed is not None:
+                self.str = self.str + committed
+
+        self.prev_char=ch1
+        self.current_symbol=ch1
+        # Optionally, a letter held steadily enough commits without the "next" gesture
+        held = self.smoother.update(ch1, confidence)
+        if held is not None:
+            self.str = self.str + held
+
+
+        if len(self.str.strip())!=0:
+            st=self.str.rfind(" ")
+            ed=len(self.str)
+            word=self.str[st+1:ed]
+            self.word=word
+            with metrics.stage('suggestions'):
+                self.generate_suggestions()
+
+    def generate_suggestions(self):
+        """Fill word1-4 for the word being spelled; cache misses are filled in later by the suggestion worker."""
+        word = self.word
+        if len(word.strip()) == 0:
+            self.word1, self.word2, self.word3, self.word4 = " ", " ", " ", " "
+            return
+        if word == self.suggesting:
+            return
+        suggestions = self.resources.suggestions.lookup(word, self._on_suggestions)
+        if suggestions is not None:
+            self.word1, self.word2, self.word3, self.word4 = suggestions
+        else:
+            self.suggesting = word
+
+    def _on_suggestions(self, word, suggestions):
+        # Runs on the suggestion worker; the session lock is not taken so a busy
+        # session never holds up lookups for the others
+        if word == self.suggesting:
+            self.suggesting = None
+        if word == self.word:
+            self.word1, self.word2, self.word3, self.word4 = suggestions
+            self._publish_state()
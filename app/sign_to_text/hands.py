@@ -0,0 +1,61 @@
+"""Bookkeeping for several hands per frame.
+
+Detected hands are matched to the hands of the previous frame by box
+position, so each keeps its 'Left'/'Right' label even when MediaPipe's
+handedness guess flickers; hands that were not there before take the
+label MediaPipe reports. Every hand besides the one spelling the sentence
+keeps its own smoothed symbol in a HandState.
+"""
+import numpy as np
+
+from app.sign_to_text.rules import classify_symbol, top_groups
+from app.sign_to_text.smoothing import SymbolSmoother
+
+SIDES = ('Right', 'Left')
+
+
+def _center(bbox):
+    x, y, w, h = bbox
+    return np.array([x + w / 2, y + h / 2], dtype=np.float32)
+
+
+def label_hands(hands, previous):
+    """Labels for hands (cvzone dicts with 'bbox' and 'type'); previous maps label -> last bbox."""
+    labels = [None] * len(hands)
+    # Nearest pairs first; a hand that moved more than about its own size counts as new
+    pairs = []
+    for i, hand in enumerate(hands):
+        for label, bbox in previous.items():
+            distance = float(np.linalg.norm(_center(hand['bbox']) - _center(bbox)))
+            if distance <= 1.5 * max(bbox[2], bbox[3]):
+                pairs.append((distance, i, label))
+    used = set()
+    for _, i, label in sorted(pairs):
+        if labels[i] is None and label not in used:
+            labels[i] = label
+            used.add(label)
+
+    for i, hand in enumerate(hands):
+        if labels[i] is not None:
+            continue
+        free = [side for side in SIDES if side not in used]
+        label = hand.get('type') if hand.get('type') in free else (free[0] if free else f"Hand{i}")
+        labels[i] = label
+        used.add(label)
+    return labels
+
+
+class HandState:
+    """Recognition state of a hand that is not spelling the sentence."""
+
+    def __init__(self, side, smoothing):
+        self.side = side
+        self.smoother = SymbolSmoother(**{**smoothing, 'hold': 0})
+        self.symbol = "Empty"
+
+    def update(self, prob, pts):
+        ch1, ch2, confidence = top_groups(prob)
+        symbol = classify_symbol(ch1, ch2, pts)
+        self.smoother.update(symbol, confidence)
+        self.symbol = self.smoother.best() or symbol
+        return self.symbol
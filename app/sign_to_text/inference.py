@@ -0,0 +1,237 @@
+from concurrent.futures import Future
+import numpy as np
+import threading
+import logging
+import queue
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
+
+
+class KerasBackend:
+    """Full Keras model loaded from an .h5 file."""
+
+    name = 'keras'
+
+    def __init__(self, model_path):
+        import tensorflow as tf
+
+        logger.info(f"Looking for model at: {model_path}")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        try:
+            self.model = tf.keras.models.load_model(model_path)
+            logger.info("Model loaded successfully")
+        except Exception as e:
+            logger.error(f"Failed to load model: {str(e)}")
+            raise
+
+    def predict(self, batch):
+        # predict_on_batch skips the tf.data pipeline model.predict builds on every call
+        return np.asarray(self.model.predict_on_batch(batch))
+
+
+class TFLiteBackend:
+    """TFLite interpreter for float or int8-quantized models.
+
+    Uses tflite_runtime when installed and falls back to tf.lite otherwise.
+    XNNPACK is the default CPU delegate in recent runtimes; use_xnnpack=False
+    selects the plain builtin kernels for comparison.
+    """
+
+    name = 'tflite'
+
+    def __init__(self, model_path, num_threads=None, use_xnnpack=True):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+            from tflite_runtime import interpreter as tflite_module
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+            tflite_module = tf.lite
+
+        logger.info(f"Looking for TFLite model at: {model_path}")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+
+        kwargs = {'model_path': model_path, 'num_threads': num_threads or os.cpu_count()}
+        resolver = getattr(getattr(tflite_module, 'experimental', tflite_module), 'OpResolverType', None)
+        if resolver is not None:
+            kwargs['experimental_op_resolver_type'] = (
+                resolver.AUTO if use_xnnpack else resolver.BUILTIN_WITHOUT_DEFAULT_DELEGATES)
+        self.interpreter = Interpreter(**kwargs)
+        self.interpreter.allocate_tensors()
+
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.input_shape = tuple(self.input['shape'][1:])
+        self.batch_size = int(self.input['shape'][0])
+        self.batchable = True
+        logger.info(f"TFLite model loaded successfully (input {self.input['dtype'].__name__}{list(self.input['shape'])}, "
+                    f"{kwargs['num_threads']} threads)")
+
+    def _resize(self, n):
+        if n == self.batch_size:
+            return True
+        if not self.batchable:
+            return False
+        try:
+            self.interpreter.resize_tensor_input(self.input['index'], [n, *self.input_shape])
+            self.interpreter.allocate_tensors()
+            self.batch_size = n
+            return True
+        except Exception as e:
+            # Fixed-shape models: fall back to one invoke per image
+            logger.info(f"TFLite model does not support batch resizing: {str(e)}")
+            self.batchable = False
+            self.interpreter.resize_tensor_input(self.input['index'], [1, *self.input_shape])
+            self.interpreter.allocate_tensors()
+            self.batch_size = 1
+            return False
+
+    def _quantize(self, batch):
+        dtype = self.input['dtype']
+        if dtype == np.float32:
+            return batch.astype(np.float32, copy=False)
+        scale, zero_point = self.input['quantization']
+        batch = np.round(batch.astype(np.float32) / scale + zero_point)
+        info = np.iinfo(dtype)
+        return np.clip(batch, info.min, info.max).astype(dtype)
+
+    def _dequantize(self, output):
+        if self.output['dtype'] == np.float32:
+            return output
+        scale, zero_point = self.output['quantization']
+        return (output.astype(np.float32) - zero_point) * scale
+
+    def _invoke(self, batch):
+        self.interpreter.set_tensor(self.input['index'], self._quantize(batch))
+        self.interpreter.invoke()
+        # copy: the output tensor buffer is reused by the next invoke
+        return self._dequantize(self.interpreter.get_tensor(self.output['index']).copy())
+
+    def predict(self, batch):
+        if self._resize(len(batch)):
+            return self._invoke(batch)
+        return np.concatenate([self._invoke(batch[i:i + 1]) for i in range(len(batch))])
+
+
+def load_backend(config):
+    """Build the inference backend selected by SIGN_MODEL_BACKEND ('keras' or 'tflite')."""
+    backend = config['SIGN_MODEL_BACKEND']
+    if backend == 'tflite':
+        return TFLiteBackend(config['SIGN_TFLITE_MODEL'] or os.path.join(MODELS_DIR, 'model.tflite'),
+                             num_threads=config['SIGN_TFLITE_THREADS'],
+                             use_xnnpack=config['SIGN_TFLITE_XNNPACK'])
+    if backend == 'keras':
+        return KerasBackend(config['SIGN_KERAS_MODEL'] or os.path.join(MODELS_DIR, 'cnn8grps_rad1_model.h5'))
+    raise ValueError(f"Unknown inference backend: {backend}")
+
+
+class BatchScheduler:
+    """Gathers single-image inference requests from many sessions into one batched call.
+
+    A batch is flushed once it holds max_batch images, once every recently
+    active caller has submitted, or once max_delay seconds have passed since
+    the first image arrived — whichever comes first. A lone caller therefore
+    never waits for the deadline.
+    """
+
+    def __init__(self, predict_fn, max_batch=8, max_delay=0.01, active_window=1.0):
+        self.predict_fn = predict_fn
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.active_window = active_window
+        self.callers = {}  # caller key -> last submit time
+        self.queue = queue.Queue()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="inference-batcher", daemon=True)
+        self.thread.start()
+
+    def submit(self, image, key=None):
+        """Queue one image; returns a Future resolving to its probability vector."""
+        return self._submit(image[None], key, single=True)
+
+    def submit_many(self, images, key=None):
+        """Queue several images of one caller (e.g. every hand in a frame) to run in the same batch.
+
+        Returns a Future resolving to their (n, classes) probabilities.
+        """
+        return self._submit(np.stack(images), key, single=False)
+
+    def _submit(self, images, key, single):
+        future = Future()
+        if key is not None:
+            self.callers[key] = time.monotonic()
+        self.queue.put((images, future, single))
+        return future
+
+    def predict(self, image, key=None, timeout=None):
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(image, key).result(timeout)
+
+    def stop(self):
+        self.running = False
+        self.queue.put(None)
+        self.thread.join(timeout=1.0)
+
+    def _expected_batch(self):
+        # Callers that submitted recently are likely to submit again within the deadline
+        cutoff = time.monotonic() - self.active_window
+        for key, last_seen in list(self.callers.items()):
+            if last_seen < cutoff:
+                self.callers.pop(key, None)
+        return max(1, min(self.max_batch, len(self.callers)))
+
+    def _run(self):
+        while self.running:
+            item = self.queue.get()
+            if item is None:
+                break
+            batch = [item]
+            size = len(item[0])  # images, not requests: a request may carry several
+            expected = self._expected_batch()
+            deadline = time.monotonic() + self.max_delay
+            while size < expected:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.running = False
+                    break
+                batch.append(item)
+                size += len(item[0])
+            # Pick up anything else already waiting without extending the deadline
+            while size < self.max_batch:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.running = False
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._flush(batch)
+
+    def _flush(self, batch):
+        try:
+            images = np.concatenate([images for images, _, _ in batch])
+            probs = self.predict_fn(images)
+        except Exception as e:
+            logger.error(f"Batched inference failed: {str(e)}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        start = 0
+        for images, future, single in batch:
+            end = start + len(images)
+            future.set_result(probs[start] if single else probs[start:end])
+            start = end
@@ -0,0 +1,80 @@
+import numpy as np
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Fingertips and the joints used to measure how far each finger is bent
+FINGERTIPS = [4, 8, 12, 16, 20]
+FINGER_JOINTS = [
+    (1, 2, 3), (2, 3, 4),
+    (5, 6, 7), (6, 7, 8),
+    (9, 10, 11), (10, 11, 12),
+    (13, 14, 15), (14, 15, 16),
+    (17, 18, 19), (18, 19, 20),
+]
+_TIP_I, _TIP_J = np.triu_indices(len(FINGERTIPS), k=1)
+_JOINTS = np.array(FINGER_JOINTS)
+
+FEATURE_SIZE = 21 * 2 + len(_TIP_I) + len(FINGER_JOINTS)
+
+
+def landmark_features(pts):
+    """Scale- and translation-invariant feature vector for one hand.
+
+    pts is the 21-point landmark list (x, y[, z]) in any pixel space. The
+    vector holds wrist-relative coordinates normalized by palm size, the
+    pairwise fingertip distances and the bend angle at each finger joint.
+    """
+    xy = np.asarray(pts, dtype=np.float32)[:, :2]
+    rel = xy - xy[0]
+    # Wrist to middle-finger MCP is stable across most hand shapes
+    scale = np.linalg.norm(rel[9]) or 1.0
+    rel /= scale
+
+    tips = rel[FINGERTIPS]
+    tip_dist = np.linalg.norm(tips[_TIP_I] - tips[_TIP_J], axis=1)
+
+    a = rel[_JOINTS[:, 0]] - rel[_JOINTS[:, 1]]
+    b = rel[_JOINTS[:, 2]] - rel[_JOINTS[:, 1]]
+    cos = np.einsum('ij,ij->i', a, b) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1) + 1e-6)
+    angles = np.arccos(np.clip(cos, -1.0, 1.0)) / np.pi
+
+    return np.concatenate([rel.ravel(), tip_dist, angles]).astype(np.float32)
+
+
+class LandmarkClassifier:
+    """Small dense network over landmark features, evaluated with plain NumPy.
+
+    Weights come from an .npz written by train_landmarks.py: feature mean/std
+    and W0, b0, W1, b1, ... for ReLU hidden layers and a softmax output over
+    the same 8 gesture groups the CNN predicts.
+    """
+
+    def __init__(self, weights_path):
+        logger.info(f"Looking for landmark model at: {weights_path}")
+        if not os.path.exists(weights_path):
+            raise FileNotFoundError(f"Model file not found: {weights_path}")
+        with np.load(weights_path) as data:
+            self.mean = data['mean'].astype(np.float32)
+            self.std = data['std'].astype(np.float32)
+            n_layers = sum(1 for key in data.files if key.startswith('W'))
+            self.layers = [(data[f'W{i}'].astype(np.float32), data[f'b{i}'].astype(np.float32))
+                           for i in range(n_layers)]
+        if self.layers[0][0].shape[0] != FEATURE_SIZE:
+            raise ValueError(f"Landmark model expects {self.layers[0][0].shape[0]} features, got {FEATURE_SIZE}")
+        logger.info("Landmark model loaded successfully")
+
+    def predict(self, features):
+        """features: (n, FEATURE_SIZE) array; returns (n, classes) probabilities."""
+        h = (np.atleast_2d(features) - self.mean) / self.std
+        for W, b in self.layers[:-1]:
+            h = np.maximum(h @ W + b, 0.0)
+        W, b = self.layers[-1]
+        logits = h @ W + b
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict_landmarks(self, pts_list):
+        return self.predict(np.stack([landmark_features(pts) for pts in pts_list]))
@@ -0,0 +1,119 @@
+"""Lightweight hot-path metrics rendered in the Prometheus text format.
+
+When disabled, stage() returns a shared no-op context manager and count()
+returns immediately, so instrumented code pays only a function call.
+"""
+from bisect import bisect_left
+import threading
+import time
+
+# Upper bounds in seconds; sized for per-frame stages (sub-millisecond to ~1s)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        # Unsynchronized increments: an occasional lost update is acceptable for monitoring
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Timer:
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    def __init__(self, enabled=False, prefix='sign_to_text'):
+        self.enabled = enabled
+        self.prefix = prefix
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def _histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+    def stage(self, name):
+        """Context manager timing one pipeline stage into the stage histogram."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self._histogram(name))
+
+    def observe(self, name, seconds):
+        """Record a stage duration measured elsewhere (e.g. in a pipeline worker process)."""
+        if self.enabled:
+            self._histogram(name).observe(seconds)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        if name not in self.counters:
+            # New keys only under the lock, so render() can snapshot consistently
+            with self.lock:
+                self.counters.setdefault(name, 0)
+        self.counters[name] += value
+
+    def render(self, gauges=None):
+        """Prometheus text exposition format (version 0.0.4); gauges are point-in-time values."""
+        with self.lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+        lines = []
+        name = f"{self.prefix}_stage_seconds"
+        lines.append(f"# HELP {name} Time spent in each sign-to-text pipeline stage.")
+        lines.append(f"# TYPE {name} histogram")
+        for stage, h in histograms:
+            cumulative = 0
+            for bound, count in zip(h.buckets, h.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum:.6f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+
+        name = f"{self.prefix}_frames_total"
+        lines.append(f"# HELP {name} Frames by outcome (processed, skipped, failed, no_hand, ...).")
+        lines.append(f"# TYPE {name} counter")
+        for outcome, value in counters:
+            lines.append(f'{name}{{outcome="{outcome}"}} {value}')
+
+        for gauge, value in sorted((gauges or {}).items()):
+            name = f"{self.prefix}_{gauge}"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,313 @@
+"""Multi-process pipeline for hand detection and gesture classification.
+
+Frames are copied once into a ring of shared-memory slots; only slot indices,
+landmarks and probabilities travel through the bounded queues:
+
+    submit() -> detect worker(s) -> classify worker -> collector thread -> Future
+
+Detection of one frame overlaps classification of earlier ones, so
+throughput approaches that of the slowest stage rather than the sum of all
+stages. Rules, sentence state and preview encoding stay in the calling
+process. Worker processes are spawned on the first submit(); if one of them
+dies, outstanding frames fail and the next submit() starts a fresh set.
+"""
+from collections import namedtuple
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+import atexit
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Largest frame a slot holds; live frames are resized to 640 wide before detection
+MAX_FRAME_SHAPE = (720, 640, 3)
+CANVAS_SHAPE = (400, 400, 3)
+# Seconds between checks that the worker processes are still running
+LIVENESS_INTERVAL = 0.5
+
+# hand: a hand was detected; pts/prob: canvas landmarks and group probabilities (None if the crop was unusable);
+# bbox: the hand's box in the frame; side: its 'Left'/'Right' label; others: Observations of further hands
+Observation = namedtuple('Observation', ['hand', 'pts', 'prob', 'bbox', 'side', 'others'], defaults=(None, None, ()))
+NO_HAND = Observation(False, None, None)
+
+
+class SharedSlots:
+    """Frame and canvas buffers for a fixed number of in-flight frames, in one shared-memory block."""
+
+    def __init__(self, slots, name=None):
+        frame_bytes = int(np.prod(MAX_FRAME_SHAPE))
+        canvas_bytes = int(np.prod(CANVAS_SHAPE))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=slots * (frame_bytes + canvas_bytes))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.frames = np.ndarray((slots,) + MAX_FRAME_SHAPE, dtype=np.uint8, buffer=self.shm.buf)
+        self.canvases = np.ndarray((slots,) + CANVAS_SHAPE, dtype=np.uint8, buffer=self.shm.buf,
+                                   offset=slots * frame_bytes)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self, unlink=False):
+        # The arrays export the buffer and must go before it can be closed
+        del self.frames, self.canvases
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _detect_worker(config, shm_name, slots, jobs, canvas_jobs, results):
+    """Hand detection and canvas construction; hands off to the classify worker (or classifies landmarks itself)."""
+    from cvzone.HandTrackingModule import HandDetector
+    from app.sign_to_text.canvas import hand_canvas, draw_keypoints
+    from app.sign_to_text.inference import MODELS_DIR
+    from app.sign_to_text.landmarks import LandmarkClassifier, landmark_features
+
+    shared = SharedSlots(slots, name=shm_name)
+    # Frames of every session pass through this worker; uploaded frames must not seed each other
+    hd = HandDetector(staticMode=config['SIGN_FRAME_SOURCE'] == 'browser', maxHands=1, detectionCon=0.7)
+    landmark_model = None
+    if config['SIGN_CLASSIFIER'] == 'landmarks':
+        landmark_model = LandmarkClassifier(
+            config['SIGN_LANDMARK_MODEL'] or os.path.join(MODELS_DIR, 'landmark_mlp.npz'))
+    # Pay MediaPipe graph setup before the first real frame
+    hd.findHands(np.zeros(MAX_FRAME_SHAPE, dtype=np.uint8), draw=False, flipType=True)
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            job_id, slot, height, width = job
+            try:
+                start = time.perf_counter()
+                image = shared.frames[slot, :height, :width]
+                hands = hd.findHands(image, draw=False, flipType=True)
+                timings = {'detect_hands': time.perf_counter() - start}
+                if not (hands and hands[0]):
+                    results.put((job_id, slot, NO_HAND, timings, None))
+                    continue
+
+                hand = hands[0][0]
+                start = time.perf_counter()
+                pts, white = hand_canvas(image, hand['bbox'], hand['lmList'], build_canvas=landmark_model is None)
+                timings['crop_canvas'] = time.perf_counter() - start
+                if pts is None:
+                    results.put((job_id, slot, Observation(True, None, None, hand['bbox']), timings, None))
+                elif landmark_model is not None:
+                    prob = landmark_model.predict(landmark_features(pts))[0]
+                    results.put((job_id, slot, Observation(True, pts, prob, hand['bbox']), timings, None))
+                else:
+                    draw_keypoints(white, pts)
+                    shared.canvases[slot] = white
+                    canvas_jobs.put((job_id, slot, pts, hand['bbox'], timings))
+            except Exception as e:
+                results.put((job_id, slot, None, {}, f"Detection failed: {str(e)}"))
+    finally:
+        shared.close()
+
+
+def _classify_worker(config, shm_name, slots, canvas_jobs, results, max_batch):
+    """CNN inference over whatever canvases are waiting, up to max_batch at a time."""
+    from app.sign_to_text.inference import load_backend
+
+    shared = SharedSlots(slots, name=shm_name)
+    backend = load_backend(config)
+    backend.predict(np.full((1,) + CANVAS_SHAPE, 255, dtype=np.uint8))
+    try:
+        stopping = False
+        while not stopping:
+            batch = [canvas_jobs.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(canvas_jobs.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            batch = [job for job in batch if job is not None]
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                probs, error = backend.predict(shared.canvases[[job[1] for job in batch]]), None
+            except Exception as e:
+                probs, error = None, f"Classification failed: {str(e)}"
+            elapsed = time.perf_counter() - start
+            for i, (job_id, slot, pts, bbox, timings) in enumerate(batch):
+                timings['classify'] = elapsed
+                observation = Observation(True, pts, probs[i], bbox) if error is None else None
+                results.put((job_id, slot, observation, timings, error))
+    finally:
+        shared.close()
+
+
+class PipelineExecutor:
+    def __init__(self, config, metrics=None, slots=8, detect_workers=1, max_batch=8):
+        self.config = config
+        self.metrics = metrics
+        self.slots = slots
+        self.detect_workers = detect_workers
+        self.max_batch = max_batch
+        self.started = False
+        self.failed = None  # why the workers stopped unexpectedly
+        self.lock = threading.Lock()
+        self.futures = {}  # job id -> Future, until its result arrives or the workers die
+        self.futures_lock = threading.Lock()
+        self.ids = itertools.count()
+        atexit.register(self.stop)
+
+    def _start(self):
+        # spawn: the parent already runs TensorFlow/MediaPipe threads, which fork does not survive
+        ctx = mp.get_context('spawn')
+        self.shared = SharedSlots(self.slots)
+        self.free = queue.Queue()
+        for slot in range(self.slots):
+            self.free.put(slot)
+        self.failed = None
+
+        # Bounded by the slot count, so a slow stage backs up into submit() instead of growing queues
+        self.jobs = ctx.Queue(maxsize=self.slots)
+        self.canvas_jobs = ctx.Queue(maxsize=self.slots)
+        self.results = ctx.Queue()
+
+        self.detectors = [ctx.Process(target=_detect_worker, name=f'sign-detect-{i}', daemon=True,
+                                      args=(self.config, self.shared.name, self.slots,
+                                            self.jobs, self.canvas_jobs, self.results))
+                          for i in range(self.detect_workers)]
+        self.classifier = None
+        if self.config['SIGN_CLASSIFIER'] == 'cnn':
+            self.classifier = ctx.Process(target=_classify_worker, name='sign-classify', daemon=True,
+                                          args=(self.config, self.shared.name, self.slots,
+                                                self.canvas_jobs, self.results, self.max_batch))
+        for process in self.detectors + [self.classifier]:
+            if process is not None:
+                process.start()
+
+        self.collector = threading.Thread(target=self._collect, name='sign-pipeline-results', daemon=True)
+        self.collector.start()
+        self.started = True
+        logger.info(f"Pipeline started with {self.detect_workers} detect worker(s) and {self.slots} frame slots")
+
+    def submit(self, image, timeout=None):
+        """Queue one resized BGR frame; returns a Future resolving to an Observation.
+
+        Blocks while all slots are in flight (up to timeout, then raises queue.Empty).
+        A caller that stops waiting may cancel the Future; its slot is freed once
+        the workers finish with the frame.
+        """
+        with self.lock:
+            if self.started and self.failed is not None:
+                logger.warning(f"Restarting pipeline workers: {self.failed}")
+                self._shutdown(timeout=1.0)
+            if not self.started:
+                self._start()
+            # One set of workers throughout, even if another thread restarts them meanwhile
+            free, shared, jobs = self.free, self.shared, self.jobs
+        height, width = image.shape[:2]
+        if height > MAX_FRAME_SHAPE[0] or width > MAX_FRAME_SHAPE[1] or image.shape[2:] != MAX_FRAME_SHAPE[2:]:
+            raise ValueError(f"Frame shape {image.shape} exceeds pipeline slots {MAX_FRAME_SHAPE}")
+
+        slot = free.get(timeout=timeout)
+        shared.frames[slot, :height, :width] = image
+        future = Future()
+        job_id = next(self.ids)
+        with self.futures_lock:
+            failed = self.failed
+            if failed is None:
+                self.futures[job_id] = future
+        if failed is not None:
+            free.put(slot)
+            raise RuntimeError(failed)
+        jobs.put((job_id, slot, height, width))
+        return future
+
+    def _workers(self):
+        return [process for process in self.detectors + [self.classifier] if process is not None]
+
+    def _collect(self):
+        next_check = time.monotonic() + LIVENESS_INTERVAL
+        while True:
+            try:
+                item = self.results.get(timeout=LIVENESS_INTERVAL)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                return
+            if item:
+                job_id, slot, observation, timings, error = item
+                self.free.put(slot)
+                if self.metrics is not None:
+                    for stage, seconds in timings.items():
+                        self.metrics.observe(stage, seconds)
+                with self.futures_lock:
+                    future = self.futures.pop(job_id, None)
+                # Skip futures the caller cancelled after giving up on them
+                if future is not None and future.set_running_or_notify_cancel():
+                    if error:
+                        future.set_exception(RuntimeError(error))
+                    else:
+                        future.set_result(observation)
+
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + LIVENESS_INTERVAL
+                dead = [process for process in self._workers() if not process.is_alive()]
+                if dead and self.started:
+                    # Their frames will never come back, so fail them now instead of at each caller's timeout
+                    self._fail(f"Pipeline worker {dead[0].name} exited with code {dead[0].exitcode}")
+                    return
+
+    def _fail(self, reason):
+        logger.error(reason)
+        with self.futures_lock:
+            self.failed = reason
+            futures, self.futures = self.futures, {}
+        for future in futures.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError(reason))
+
+    def stop(self, timeout=5.0):
+        with self.lock:
+            if self.started:
+                self._shutdown(timeout)
+
+    def _shutdown(self, timeout):
+        self.started = False
+        # Detect workers drain first, so every canvas they hand off is still classified.
+        # Puts are bounded: a dead worker leaves its queue full.
+        for _ in self.detectors:
+            try:
+                self.jobs.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for process in self.detectors:
+            process.join(timeout)
+        if self.classifier is not None:
+            try:
+                self.canvas_jobs.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self.classifier.join(timeout)
+        for process in self._workers():
+            if process.is_alive():
+                logger.warning(f"Terminating pipeline worker {process.name}")
+                process.terminate()
+                process.join(timeout)
+        self.results.put(None)
+        self.collector.join(timeout)
+        with self.futures_lock:
+            futures, self.futures = self.futures, {}
+        for future in futures.values():
+            future.cancel()
+        # Queues of a terminated worker may hold a half-written message; do not wait on their feeder threads
+        for q in (self.jobs, self.canvas_jobs, self.results):
+            q.cancel_join_thread()
+            q.close()
+        self.shared.close(unlink=True)
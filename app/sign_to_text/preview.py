@@ -0,0 +1,61 @@
+"""JPEG encoding of the live preview at a client-selected resolution/quality tier.
+
+Frames that look the same as the last one sent (compared on a tiny
+thumbnail) are not re-encoded, except for a periodic keyframe so newly
+attached clients always get an image.
+"""
+import time
+import numpy as np
+import cv2
+
+NO_PREVIEW = 'none'
+
+# Thumbnail size used to detect unchanged frames
+THUMB_SIZE = (32, 24)
+
+
+class PreviewEncoder:
+    def __init__(self, tiers, tier, keyframe_interval=1.0, change_threshold=2.0):
+        self.tiers = tiers  # name -> (max width, JPEG quality)
+        self.tier = tier if tier in tiers or tier == NO_PREVIEW else next(iter(tiers))
+        self.keyframe_interval = keyframe_interval
+        self.change_threshold = change_threshold  # mean absolute thumbnail difference, 0-255
+        self.buffers = {}  # (width, height) -> resize destination reused across frames
+        self.thumb = None
+        self.last_sent = 0.0
+
+    @property
+    def enabled(self):
+        return self.tier != NO_PREVIEW
+
+    def set_tier(self, tier):
+        """Switch to a named tier or 'none'; unknown or empty names keep the current tier."""
+        if tier and tier != self.tier and (tier in self.tiers or tier == NO_PREVIEW):
+            self.tier = tier
+            self.thumb = None
+        return self.tier
+
+    def encode(self, image):
+        """JPEG bytes of image at the current tier, or None when disabled or unchanged since the last frame sent."""
+        if not self.enabled:
+            return None
+        width, quality = self.tiers[self.tier]
+
+        height, full_width = image.shape[:2]
+        if full_width > width:
+            size = (width, int(width * height / full_width))
+            dst = self.buffers.get(size)
+            if dst is None:
+                dst = self.buffers[size] = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            image = cv2.resize(image, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+        now = time.monotonic()
+        thumb = cv2.resize(image, THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        if (self.thumb is not None and now - self.last_sent < self.keyframe_interval and
+                cv2.absdiff(thumb, self.thumb).mean() < self.change_threshold):
+            return None
+        self.thumb = thumb
+        self.last_sent = now
+
+        _, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        return buffer.tobytes()
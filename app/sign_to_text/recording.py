@@ -0,0 +1,174 @@
+"""Record what the detector saw per frame, and replay it through the post-model logic.
+
+A recording is a directory of plain .npy arrays (loaded memory-mapped on
+replay) plus a small meta.json:
+
+    flags.npy      uint8 (N,)         bit 0: hand detected, bit 1: landmarks/probabilities valid
+    landmarks.npy  int16 (N, 21, 3)   canvas-space landmarks (self.pts)
+    bbox.npy       int16 (N, 4)       hand box in the frame (x, y, w, h)
+    probs.npy      float32 (N, 8)     gesture-group probabilities
+    symbols.npy    int8 (N,)          current symbol after the frame, index into RECORD_SYMBOLS
+    meta.json                         smoothing settings and (frame, sentence) change events
+
+Replay needs neither MediaPipe nor TensorFlow, so the rule cascade and
+smoothing run at thousands of frames per second:
+
+    python -m app.sign_to_text.recording RECORDING [RECORDING ...] [--repeat N]
+
+It reports throughput and exits non-zero if the replayed symbols or
+sentences differ from the recorded ones.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import numpy as np
+
+from app.sign_to_text.smoothing import SYMBOLS
+
+logger = logging.getLogger(__name__)
+
+RECORD_SYMBOLS = SYMBOLS + ['Empty']
+FLAG_HAND = 1
+FLAG_VALID = 2
+NUM_GROUPS = 8
+
+
+class LandmarkRecorder:
+    """Accumulates per-frame arrays in memory (growing by doubling) and writes them on close()."""
+
+    def __init__(self, path, settings=None, capacity=1024):
+        self.path = path
+        self.settings = settings or {}
+        self.n = 0
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.landmarks = np.zeros((capacity, 21, 3), dtype=np.int16)
+        self.bbox = np.zeros((capacity, 4), dtype=np.int16)
+        self.probs = np.zeros((capacity, NUM_GROUPS), dtype=np.float32)
+        self.symbols = np.full(capacity, -1, dtype=np.int8)
+        self.sentences = []
+        self.last_sentence = None
+
+    def _grow(self):
+        for name in ('flags', 'landmarks', 'bbox', 'probs', 'symbols'):
+            array = getattr(self, name)
+            grown = np.zeros((len(array) * 2,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add(self, observation, symbol, sentence):
+        """Record one frame: the observation fed to the session and the state it produced."""
+        if self.n == len(self.flags):
+            self._grow()
+        i = self.n
+        flags = 0
+        if observation is not None and observation.hand:
+            flags |= FLAG_HAND
+            if observation.bbox is not None:
+                self.bbox[i] = observation.bbox
+            if observation.pts is not None:
+                flags |= FLAG_VALID
+                pts = np.asarray(observation.pts)
+                self.landmarks[i, :, :pts.shape[1]] = pts[:, :3]
+                self.probs[i] = observation.prob
+        self.flags[i] = flags
+        self.symbols[i] = RECORD_SYMBOLS.index(symbol) if symbol in RECORD_SYMBOLS else -1
+        if sentence != self.last_sentence:
+            self.sentences.append((i, sentence))
+            self.last_sentence = sentence
+        self.n += 1
+
+    def close(self):
+        os.makedirs(self.path, exist_ok=True)
+        for name in ('flags', 'landmarks', 'bbox', 'probs', 'symbols'):
+            np.save(os.path.join(self.path, f"{name}.npy"), getattr(self, name)[:self.n])
+        with open(os.path.join(self.path, 'meta.json'), 'w') as f:
+            json.dump({'frames': self.n, 'settings': self.settings, 'sentences': self.sentences}, f)
+        logger.info(f"Saved {self.n} recorded frames to {self.path}")
+
+
+class Recording:
+    """A saved recording, with the arrays memory-mapped."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        for name in ('flags', 'landmarks', 'bbox', 'probs', 'symbols'):
+            setattr(self, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r'))
+
+    def __len__(self):
+        return len(self.flags)
+
+    def observations(self):
+        from app.sign_to_text.pipeline import Observation, NO_HAND
+
+        for i in range(len(self)):
+            flags = int(self.flags[i])
+            if not flags & FLAG_HAND:
+                yield NO_HAND
+            elif not flags & FLAG_VALID:
+                yield Observation(True, None, None, tuple(self.bbox[i]))
+            else:
+                yield Observation(True, self.landmarks[i].tolist(), np.array(self.probs[i]), tuple(self.bbox[i]))
+
+
+def replay(recording, settings):
+    """Feed a recording through a model-free detector session.
+
+    Returns (frames/sec, mismatched symbol frames, replayed sentence events).
+    """
+    from app.sign_to_text.detector import ReplayResources, SignLanguageDetector
+
+    resources = ReplayResources(settings, smoothing=recording.meta.get('settings'))
+    detector = SignLanguageDetector(resources)
+    replayed = np.empty(len(recording), dtype=np.int8)
+    sentences = []
+    last_sentence = None
+
+    start = time.perf_counter()
+    for i, observation in enumerate(recording.observations()):
+        detector._update(observation, resources.metrics)
+        replayed[i] = RECORD_SYMBOLS.index(detector.current_symbol) if detector.current_symbol in RECORD_SYMBOLS else -1
+        if detector.str != last_sentence:
+            sentences.append((i, detector.str))
+            last_sentence = detector.str
+    elapsed = time.perf_counter() - start
+
+    mismatches = int(np.count_nonzero(replayed != np.asarray(recording.symbols)))
+    return len(recording) / elapsed if elapsed > 0 else 0.0, mismatches, sentences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay landmark recordings through the rule cascade and smoothing")
+    parser.add_argument('recordings', nargs='+', help="Recording directories")
+    parser.add_argument('--repeat', type=int, default=1, help="Replay each recording this many times (profiling)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    from app.sign_to_text.detector import load_settings
+    settings = load_settings()
+
+    failed = False
+    for path in args.recordings:
+        recording = Recording(path)
+        expected = [tuple(event) for event in recording.meta['sentences']]
+        for _ in range(args.repeat):
+            fps, mismatches, sentences = replay(recording, settings)
+        diverged = mismatches or [tuple(event) for event in sentences] != expected
+        failed = failed or bool(diverged)
+        print(json.dumps({
+            'recording': path,
+            'frames': len(recording),
+            'fps': round(fps, 1),
+            'symbol_mismatches': mismatches,
+            'sentence': sentences[-1][1].strip() if sentences else '',
+            'matches_recording': not diverged,
+        }))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Gesture rule cascade expressed as data.
+
+The CNN (or landmark classifier) predicts one of 8 gesture groups. Its top
+two groups (ch1, ch2) select which hand-written landmark rules may
+re-assign ch1; the surviving group is then split into letters by landmark
+geometry. Rules are evaluated in table order, exactly like the original
+chain of ``if pl in l`` checks, but only the rules indexed under the
+current (ch1, ch2) pair are ever looked at.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+import numpy as np
+
+TIPS = [8, 12, 16, 20]
+PIPS = [6, 10, 14, 18]
+
+
+class HandFeatures:
+    """Landmark features computed once per frame with NumPy.
+
+    x, y: landmark coordinates; d: 21x21 pairwise distance matrix;
+    fingers: index..pinky state as a 4-char string, 'U' when the tip is
+    above its PIP joint, 'D' when below and '=' when level.
+    """
+
+    __slots__ = ('x', 'y', 'd', 'fingers')
+
+    def __init__(self, pts):
+        p = np.asarray(pts, dtype=np.float64)[:, :2]
+        diff = p[:, None, :] - p[None, :, :]
+        self.d = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff)).tolist()
+        self.x = p[:, 0].tolist()
+        self.y = p[:, 1].tolist()
+        tip_y, pip_y = p[TIPS, 1], p[PIPS, 1]
+        state = np.where(pip_y > tip_y, 'U', np.where(pip_y < tip_y, 'D', '='))
+        self.fingers = ''.join(state.tolist())
+
+
+Rule = namedtuple('Rule', 'name pairs target test')
+
+
+class RuleTable:
+    """Rules compiled into an index from (ch1, ch2) to the ordered rule positions that match it."""
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        index = {}
+        for i, rule in enumerate(self.rules):
+            for pair in rule.pairs:
+                positions = index.setdefault(tuple(pair), [])
+                if not positions or positions[-1] != i:
+                    positions.append(i)
+        self.index = {pair: tuple(positions) for pair, positions in index.items()}
+
+    def apply(self, ch1, ch2, f):
+        """Run the cascade for the top-two groups; returns the refined ch1."""
+        pos = 0
+        while True:
+            candidates = self.index.get((ch1, ch2))
+            if not candidates:
+                return ch1
+            k = bisect_left(candidates, pos)
+            if k == len(candidates):
+                return ch1
+            i = candidates[k]
+            rule = self.rules[i]
+            if rule.test(f):
+                ch1 = rule.target
+            pos = i + 1
+
+
+def _x0_left_of_tips(f, margin=0):
+    return all(f.x[0] + margin < f.x[t] for t in TIPS)
+
+
+def _x0_right_of_tips(f):
+    return all(f.x[0] > f.x[t] for t in TIPS)
+
+
+GROUP_RULES = RuleTable([
+    Rule('[Aemnst]',
+         [[5, 2], [5, 3], [3, 5], [3, 6], [3, 0], [3, 2], [6, 4], [6, 1], [6, 2], [6, 6], [6, 7], [6, 0], [6, 5],
+          [4, 1], [1, 0], [1, 1], [6, 3], [1, 6], [5, 6], [5, 1], [4, 5], [1, 4], [1, 5], [2, 0], [2, 6], [4, 6],
+          [1, 0], [5, 7], [1, 6], [6, 1], [7, 6], [2, 5], [7, 1], [5, 4], [7, 0], [7, 5], [7, 2]],
+         0, lambda f: f.fingers == 'DDDD'),
+    Rule('[o][s]', [[2, 2], [2, 1]], 0, lambda f: f.x[5] < f.x[4]),
+    Rule('[c0][aemnst]', [[0, 0], [0, 6], [0, 2], [0, 5], [0, 1], [0, 7], [5, 2], [7, 6], [7, 1]],
+         2, lambda f: _x0_right_of_tips(f) and f.x[5] > f.x[4]),
+    Rule('[c0][aemnst] 2', [[6, 0], [6, 6], [6, 2]], 2, lambda f: f.d[8][16] < 52),
+    Rule('[gh][bdfikruvw]', [[1, 4], [1, 5], [1, 6], [1, 3], [1, 0]],
+         3, lambda f: f.fingers[0] == 'U' and f.fingers[2:] == 'DD' and _x0_left_of_tips(f)),
+    Rule('[gh][l]', [[4, 6], [4, 1], [4, 5], [4, 3], [4, 7]], 3, lambda f: f.x[4] > f.x[0]),
+    Rule('[gh][pqz]', [[5, 3], [5, 0], [5, 7], [5, 4], [5, 2], [5, 1], [5, 5]], 3, lambda f: f.y[2] + 15 < f.y[16]),
+    Rule('[l][x]', [[6, 4], [6, 1], [6, 2]], 4, lambda f: f.d[4][11] > 55),
+    Rule('[l][d]', [[1, 4], [1, 6], [1, 1]], 4, lambda f: f.d[4][11] > 50 and f.fingers == 'UDDD'),
+    Rule('[l][gh]', [[3, 6], [3, 4]], 4, lambda f: f.x[4] < f.x[0]),
+    # The original cascade repeated this rule verbatim; the repeat could never fire
+    Rule('[l][c0]', [[2, 2], [2, 5], [2, 4]], 4, lambda f: f.x[1] < f.x[12]),
+    Rule('[gh][z]', [[3, 6], [3, 5], [3, 4]], 5, lambda f: f.fingers == 'UDDD' and f.y[4] > f.y[10]),
+    Rule('[gh][pq]', [[3, 2], [3, 1], [3, 6]], 5, lambda f: all(f.y[4] + 17 > f.y[t] for t in TIPS)),
+    Rule('[l][pqz]', [[4, 4], [4, 5], [4, 2], [7, 5], [7, 6], [7, 0]], 5, lambda f: f.x[4] > f.x[0]),
+    Rule('[pqz][aemnst]', [[0, 2], [0, 6], [0, 1], [0, 5], [0, 0], [0, 7], [0, 4], [0, 3], [2, 7]],
+         5, lambda f: _x0_left_of_tips(f)),
+    Rule('[pqz][yj]', [[5, 7], [5, 2], [5, 6]], 7, lambda f: f.x[3] < f.x[0]),
+    Rule('[l][yj]', [[4, 6], [4, 2], [4, 4], [4, 1], [4, 5], [4, 7]], 7, lambda f: f.y[6] < f.y[8]),
+    Rule('[x][yj]', [[6, 7], [0, 7], [0, 1], [0, 0], [6, 4], [6, 6], [6, 5], [6, 1]], 7, lambda f: f.y[18] > f.y[20]),
+    Rule('[x][aemnst]', [[0, 4], [0, 2], [0, 3], [0, 1], [0, 6]], 6, lambda f: f.x[5] > f.x[16]),
+    Rule('[yj][x]', [[7, 2]], 6, lambda f: f.y[18] < f.y[20] and f.y[8] < f.y[10]),
+    Rule('[c0][x]', [[2, 1], [2, 2], [2, 6], [2, 7], [2, 0]], 6, lambda f: f.d[8][16] > 50),
+    Rule('[l][x] 2', [[4, 6], [4, 2], [4, 1], [4, 4]], 6, lambda f: f.d[4][11] < 60),
+    Rule('[x][d]', [[1, 4], [1, 6], [1, 0], [1, 2]], 6, lambda f: f.x[5] - f.x[4] - 15 > 0),
+    Rule('[b][pqz]',
+         [[5, 0], [5, 1], [5, 4], [5, 5], [5, 6], [6, 1], [7, 6], [0, 2], [7, 1], [7, 4], [6, 6], [7, 2], [5, 0],
+          [6, 3], [6, 4], [7, 5], [7, 2]],
+         1, lambda f: f.fingers == 'UUUU'),
+    Rule('[f][pqz]',
+         [[6, 1], [6, 0], [0, 3], [6, 4], [2, 2], [0, 6], [6, 2], [7, 6], [4, 6], [4, 1], [4, 2], [0, 2], [7, 1],
+          [7, 4], [6, 6], [7, 2], [7, 5], [7, 2]],
+         1, lambda f: f.fingers == 'DUUU'),
+    Rule('[f][pqz] 2', [[6, 1], [6, 0], [4, 2], [4, 1], [4, 6], [4, 4]], 1, lambda f: f.fingers[1:] == 'UUU'),
+    Rule('[d][pqz]', [[5, 0], [3, 4], [3, 0], [3, 1], [3, 5], [5, 5], [5, 4], [5, 1], [7, 6]],
+         1, lambda f: f.fingers == 'UDDD' and f.x[2] < f.x[0] and f.y[4] > f.y[14]),
+    Rule('[d][pqz] 2', [[4, 1], [4, 2], [4, 4]], 1, lambda f: f.d[4][11] < 50 and f.fingers == 'UDDD'),
+    Rule('[d][pqz] 3', [[3, 4], [3, 0], [3, 1], [3, 5], [3, 6]],
+         1, lambda f: f.fingers == 'UDDD' and f.x[2] < f.x[0] and f.y[14] < f.y[4]),
+    Rule('[d][pqz] 4', [[6, 6], [6, 4], [6, 1], [6, 2]], 1, lambda f: f.x[5] - f.x[4] - 15 < 0),
+    Rule('[i][pqz]', [[5, 4], [5, 5], [5, 1], [0, 3], [0, 7], [5, 0], [0, 2], [6, 2], [7, 5], [7, 1], [7, 6], [7, 7]],
+         1, lambda f: f.fingers == 'DDDU'),
+    Rule('[yj][bfdi]', [[1, 5], [1, 7], [1, 1], [1, 6], [1, 3], [1, 0]],
+         7, lambda f: f.x[4] < f.x[5] + 15 and f.fingers == 'DDDU'),
+    Rule('[uvr]', [[5, 5], [5, 0], [5, 4], [5, 1], [4, 6], [4, 1], [7, 6], [3, 0], [3, 5]],
+         1, lambda f: f.fingers == 'UUDD' and f.y[4] > f.y[14]),
+    Rule('[w]', [[3, 5], [3, 0], [3, 6], [5, 1], [4, 1], [2, 0], [5, 0], [5, 5]],
+         1, lambda f: not _x0_left_of_tips(f, margin=13) and not _x0_right_of_tips(f) and f.d[4][11] < 50),
+    Rule('[w] 2', [[5, 0], [5, 5], [0, 1]], 1, lambda f: f.fingers[:3] == 'UUU'),
+])
+
+
+def resolve_letter(ch1, f):
+    """Split a gesture group into a letter using landmark geometry."""
+    x, y, d = f.x, f.y, f.d
+    if ch1 == 0:
+        ch1 = 'S'
+        if x[4] < x[6] and x[4] < x[10] and x[4] < x[14] and x[4] < x[18]:
+            ch1 = 'A'
+        if x[4] > x[6] and x[4] < x[10] and x[4] < x[14] and x[4] < x[18] and y[4] < y[14] and y[4] < y[18]:
+            ch1 = 'T'
+        if y[4] > y[8] and y[4] > y[12] and y[4] > y[16] and y[4] > y[20]:
+            ch1 = 'E'
+        if x[4] > x[6] and x[4] > x[10] and x[4] > x[14] and y[4] < y[18]:
+            ch1 = 'M'
+        if x[4] > x[6] and x[4] > x[10] and y[4] < y[18] and y[4] < y[14]:
+            ch1 = 'N'
+    elif ch1 == 2:
+        ch1 = 'C' if d[12][4] > 42 else 'O'
+    elif ch1 == 3:
+        ch1 = 'G' if d[8][12] > 72 else 'H'
+    elif ch1 == 7:
+        ch1 = 'Y' if d[8][4] > 42 else 'J'
+    elif ch1 == 4:
+        ch1 = 'L'
+    elif ch1 == 6:
+        ch1 = 'X'
+    elif ch1 == 5:
+        if x[4] > x[12] and x[4] > x[16] and x[4] > x[20]:
+            ch1 = 'Z' if y[8] < y[5] else 'Q'
+        else:
+            ch1 = 'P'
+    elif ch1 == 1:
+        fingers = f.fingers
+        spread = d[8][12] - d[6][10]
+        if fingers == 'UUUU':
+            ch1 = 'B'
+        if fingers == 'UDDD':
+            ch1 = 'D'
+        if fingers == 'DUUU':
+            ch1 = 'F'
+        if fingers == 'DDDU':
+            ch1 = 'I'
+        if fingers == 'UUUD':
+            ch1 = 'W'
+        if fingers == 'UUDD' and y[4] < y[9]:
+            ch1 = 'K'
+        if spread < 8 and fingers == 'UUDD':
+            ch1 = 'U'
+        if spread >= 8 and fingers == 'UUDD' and y[4] > y[9]:
+            ch1 = 'V'
+        if x[8] > x[12] and fingers == 'UUDD':
+            ch1 = 'R'
+    return ch1
+
+
+def resolve_gesture(ch1, f):
+    """Map letters to the space / next / backspace control gestures where they apply."""
+    x, y = f.x, f.y
+    if ch1 in (1, 'E', 'S', 'X', 'Y', 'B'):
+        if f.fingers == 'UDDU':
+            ch1 = " "
+
+    if ch1 in ('E', 'Y', 'B'):
+        if x[4] < x[5] and f.fingers == 'UUUU':
+            ch1 = "next"
+
+    # The original guard here (`ch1 == 'Next' or 'B' or ...`) was always true,
+    # so the backspace gesture is checked for every symbol
+    if (all(x[0] > x[t] for t in TIPS) and all(y[4] < y[t] for t in TIPS)
+            and all(y[4] < y[p] for p in PIPS)):
+        ch1 = 'Backspace'
+    return ch1
+
+
+def classify_symbol(ch1, ch2, pts):
+    """Full rule pipeline: top-two groups plus landmarks to a letter or control gesture."""
+    f = HandFeatures(pts)
+    ch1 = GROUP_RULES.apply(ch1, ch2, f)
+    ch1 = resolve_letter(ch1, f)
+    return resolve_gesture(ch1, f)
+
+
+def top_groups(prob):
+    """The two most likely gesture groups (ch1, ch2) and ch1's probability."""
+    prob = np.array(prob, dtype='float32')
+    ch1 = int(np.argmax(prob, axis=0))
+    confidence = float(prob[ch1])
+    prob[ch1] = 0
+    ch2 = int(np.argmax(prob, axis=0))
+    return ch1, ch2, confidence
@@ -0,0 +1,59 @@
+"""Per-session frame scheduling against an end-to-end latency budget.
+
+Each frame is either run through the full pipeline (hand detection and
+classification), turned into a preview only (resize and encode, with the
+previous recognition result), or answered with the previous result
+outright. Decisions are based on moving averages of what those paths
+recently cost, so that under load a session detects less often instead of
+queueing frames behind the model.
+"""
+import time
+
+FULL = 'full'
+PREVIEW = 'preview'
+REUSE = 'reuse'
+
+
+class FrameScheduler:
+    def __init__(self, budget=0.08, min_interval=0.025, max_load=0.5, alpha=0.2):
+        self.budget = budget  # seconds one frame may take end to end
+        self.min_interval = min_interval  # cap on the full-pass rate, even when idle
+        self.max_load = max_load  # share of wall time a session may spend on over-budget full passes
+        self.alpha = alpha
+        self.cost = {FULL: None, PREVIEW: None}
+        self.last_full = None
+        self.last_preview = None
+
+    def decide(self, now=None):
+        """Pick FULL, PREVIEW or REUSE for the next frame."""
+        now = time.monotonic() if now is None else now
+        full_cost = self.cost[FULL]
+        if full_cost is None or self.last_full is None:
+            return FULL
+
+        since = now - self.last_full
+        if since >= self.min_interval:
+            if full_cost <= self.budget:
+                return FULL
+            # Over budget: space full passes out so they take at most max_load of the time
+            if since >= full_cost * (1 - self.max_load) / self.max_load:
+                return FULL
+
+        # Previews are cheap; only when even they exceed the budget are they rate limited too
+        preview_cost = self.cost[PREVIEW]
+        if (preview_cost is not None and preview_cost > self.budget and
+                now - self.last_preview < preview_cost):
+            return REUSE
+        return PREVIEW
+
+    def record(self, mode, duration, now=None):
+        """Feed back how long a FULL or PREVIEW frame took (including any lock waits)."""
+        if mode not in self.cost:
+            return
+        previous = self.cost[mode]
+        self.cost[mode] = duration if previous is None else previous + self.alpha * (duration - previous)
+        now = time.monotonic() if now is None else now
+        if mode == FULL:
+            self.last_full = now
+        else:
+            self.last_preview = now
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from contextlib import nullcontext
+import threading
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class SessionManager:
+    """Keeps one detector per client session, evicting idle ones (LRU + TTL).
+
+    factory is called with no arguments to build a new per-session detector;
+    the detector may define close() to release anything it holds, which is
+    called under its lock attribute, if it has one.
+    """
+
+    def __init__(self, factory, max_sessions=32, ttl=600):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.sessions = OrderedDict()  # session id -> (detector, last_used)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def new_id():
+        return uuid.uuid4().hex
+
+    def get(self, session_id):
+        """Return the detector for session_id, creating it if needed."""
+        created = None
+        while True:
+            now = time.monotonic()
+            evicted = []
+            with self.lock:
+                entry = self.sessions.pop(session_id, None)
+                if entry is not None:
+                    detector = entry[0]
+                    if created is not None:
+                        # Another request for this session won the race; drop our copy
+                        evicted.append((session_id, (created, now)))
+                elif created is not None:
+                    detector = created
+                if entry is not None or created is not None:
+                    self.sessions[session_id] = (detector, now)
+                    evicted.extend(self._expire(now))
+                    while len(self.sessions) > self.max_sessions:
+                        evicted.append(self.sessions.popitem(last=False))
+            if entry is None and created is None:
+                # May load models for a long time; other clients must not wait on the lock meanwhile
+                created = self.factory()
+                continue
+            self._close(evicted)
+            return detector
+
+    def peek(self, session_id):
+        """Return the detector for session_id without creating or touching it."""
+        with self.lock:
+            entry = self.sessions.get(session_id)
+            return entry[0] if entry else None
+
+    def touch(self, session_id, detector):
+        """Mark the session as used; False once detector is no longer the session's detector.
+
+        Long-lived streams call this for every chunk, so an active stream is
+        never the idle session that gets evicted.
+        """
+        with self.lock:
+            entry = self.sessions.get(session_id)
+            if entry is None or entry[0] is not detector:
+                return False
+            self.sessions[session_id] = (detector, time.monotonic())
+            self.sessions.move_to_end(session_id)
+            return True
+
+    def remove(self, session_id):
+        with self.lock:
+            entry = self.sessions.pop(session_id, None)
+        if entry:
+            self._close([(session_id, entry)])
+
+    def expire(self):
+        """Evict sessions idle for longer than ttl."""
+        with self.lock:
+            evicted = self._expire(time.monotonic())
+        self._close(evicted)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def _expire(self, now):
+        # Entries are kept in least-recently-used order, so stop at the first fresh one
+        evicted = []
+        while self.sessions:
+            session_id, (detector, last_used) = next(iter(self.sessions.items()))
+            if now - last_used <= self.ttl:
+                break
+            evicted.append(self.sessions.popitem(last=False))
+        return evicted
+
+    def _close(self, evicted):
+        for session_id, (detector, _) in evicted:
+            logger.info(f"Evicting detector session {session_id}")
+            close = getattr(detector, 'close', None)
+            if close:
+                try:
+                    # Wait for a request still working on this session
+                    with getattr(detector, 'lock', None) or nullcontext():
+                        close()
+                except Exception as e:
+                    logger.error(f"Error closing session {session_id}: {str(e)}")
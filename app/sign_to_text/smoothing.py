@@ -0,0 +1,89 @@
+"""Temporal smoothing of per-frame symbols before they are committed to the sentence.
+
+Every frame adds a confidence-weighted one-hot row for the recognized symbol
+to a fixed-size ring buffer. Scores are either a windowed vote (sum over the
+buffer) or an exponential moving average, each updated in one NumPy step.
+A symbol only counts once its share of the smoothed score reaches the
+commit threshold, so single misrecognized frames are not committed.
+"""
+from string import ascii_uppercase
+import numpy as np
+
+# Everything classify_symbol() can return
+SYMBOLS = list(ascii_uppercase) + ['next', 'Backspace', ' ']
+LETTERS = frozenset(ascii_uppercase)
+
+
+class SymbolSmoother:
+    def __init__(self, window=10, mode='vote', alpha=0.5, threshold=0.5, guard=2, hold=0, symbols=SYMBOLS):
+        if mode not in ('vote', 'ema'):
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+        self.symbols = list(symbols)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.window = window
+        self.mode = mode
+        self.alpha = alpha
+        self.threshold = threshold  # share of the smoothed score a symbol needs to be committed
+        self.guard = min(guard, window - 1)  # newest frames ignored when committing (transition into the gesture)
+        self.hold = min(hold, window)  # frames a letter must dominate to commit without "next"; 0 disables
+        # history[i]: weighted one-hot of frame i; scores[i]: EMA after frame i (same ring positions)
+        self.history = np.zeros((window, len(self.symbols)), dtype=np.float32)
+        self.scores = np.zeros_like(self.history)
+        self.pos = 0
+        self.last_auto = None
+
+    def reset(self):
+        self.history.fill(0)
+        self.scores.fill(0)
+        self.last_auto = None
+
+    def update(self, symbol, confidence=1.0):
+        """Add one frame; returns a letter to commit when it has been held for `hold` frames, else None."""
+        previous = self.scores[(self.pos - 1) % self.window]
+        row = self.history[self.pos]
+        row.fill(0)
+        i = self.index.get(symbol)
+        if i is not None:
+            row[i] = confidence
+        np.multiply(previous, 1.0 - self.alpha, out=self.scores[self.pos])
+        self.scores[self.pos] += self.alpha * row
+        self.pos = (self.pos + 1) % self.window
+
+        if not self.hold:
+            return None
+        # Weighted share of the last `hold` frames, so a letter needs most of them to itself
+        held = self._recent(self.hold).sum(axis=0) / self.hold
+        i = int(np.argmax(held))
+        symbol = self.symbols[i] if held[i] > 0 else None
+        if symbol != self.last_auto:
+            # Re-arm once something else dominates, so a held letter commits once
+            self.last_auto = None
+        if symbol in LETTERS and held[i] >= self.threshold and self.last_auto is None:
+            self.last_auto = symbol
+            # Start over so "next" does not commit the same letter again
+            self.history.fill(0)
+            self.scores.fill(0)
+            return symbol
+        return None
+
+    def best(self, exclude=()):
+        """Dominant symbol over the window before the guard frames, if its share reaches the threshold."""
+        if self.mode == 'ema':
+            scores = self.scores[(self.pos - 1 - self.guard) % self.window].copy()
+        else:
+            scores = self.history.sum(axis=0) - self._recent(self.guard).sum(axis=0)
+        for symbol in exclude:
+            scores[self.index[symbol]] = 0
+        symbol, share = self._best(scores)
+        return symbol if share >= self.threshold else None
+
+    def _recent(self, n):
+        """The n newest history rows."""
+        return self.history[(self.pos - 1 - np.arange(n)) % self.window]
+
+    def _best(self, scores):
+        total = scores.sum()
+        if total <= 0:
+            return None, 0.0
+        i = int(np.argmax(scores))
+        return self.symbols[i], float(scores[i] / total)
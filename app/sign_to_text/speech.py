@@ -0,0 +1,151 @@
+"""Text-to-speech off the request threads, with the rendered audio cached on disk.
+
+One pyttsx3 engine lives on a dedicated worker thread (engines are not
+thread-safe and expensive to create) and renders queued sentences to audio
+files, which the browser fetches and plays. Files are keyed by
+(text, voice, rate), so a repeated phrase is served straight from the
+cache; the least recently used files are deleted beyond cache_size.
+"""
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import queue
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# pyttsx3's macOS driver (nsss) always writes AIFF; espeak and SAPI5 write WAV
+AUDIO_EXTENSION = '.aiff' if sys.platform == 'darwin' else '.wav'
+AUDIO_MIMETYPE = 'audio/aiff' if sys.platform == 'darwin' else 'audio/wav'
+
+
+def speech_key(text, voice, rate):
+    """Cache key (and file name) for one rendering of text."""
+    return hashlib.sha1(f"{voice}\n{rate}\n{text}".encode('utf-8')).hexdigest()
+
+
+class SpeechService:
+    def __init__(self, cache_dir, voice='', rate=150, cache_size=256):
+        self.cache_dir = cache_dir
+        self.voice = voice  # pyttsx3 voice id; empty uses the engine's first voice
+        self.rate = rate
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # key -> audio file path, least recently used first
+        self.pending = set()
+        self.errors = {}  # key -> why its last rendering failed
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_cache()
+        self.worker = threading.Thread(target=self._run, name='speech', daemon=True)
+        self.worker.start()
+
+    def _load_cache(self):
+        # Keep files rendered by earlier runs, oldest first
+        paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                 if name.endswith(AUDIO_EXTENSION)]
+        for path in sorted(paths, key=os.path.getmtime):
+            self.cache[os.path.basename(path)[:-len(AUDIO_EXTENSION)]] = path
+        self._evict()
+
+    def synthesize(self, text, voice=None, rate=None):
+        """Key of the audio for text; queues rendering unless it is cached or already queued."""
+        voice = self.voice if voice is None else voice
+        rate = self.rate if rate is None else rate
+        key = speech_key(text, voice, rate)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif key not in self.pending:
+                self.pending.add(key)
+                self.errors.pop(key, None)
+                self.queue.put((key, text, voice, rate))
+        return key
+
+    def status(self, key):
+        """(state, detail): ('ready', path), ('pending', None), ('failed', error) or (None, None) if unknown."""
+        with self.lock:
+            path = self.cache.get(key)
+            if path is not None:
+                self.cache.move_to_end(key)
+                return 'ready', path
+            if key in self.pending:
+                return 'pending', None
+            if key in self.errors:
+                return 'failed', self.errors[key]
+        return None, None
+
+    def open(self, key):
+        """Like status(), but a ready entry comes back as an open file.
+
+        The file is opened under the lock, so eviction cannot delete it between
+        the lookup and the open; an open file stays readable after deletion.
+        """
+        with self.lock:
+            path = self.cache.get(key)
+            if path is not None:
+                try:
+                    f = open(path, 'rb')
+                except OSError as e:
+                    # Removed behind our back; render it again on the next request
+                    logger.warning(f"Cached speech {path} is gone: {str(e)}")
+                    del self.cache[key]
+                    return None, None
+                self.cache.move_to_end(key)
+                return 'ready', f
+        return self.status(key)
+
+    def stop(self):
+        self.queue.put(None)
+
+    def _evict(self):
+        while len(self.cache) > self.cache_size:
+            _, path = self.cache.popitem(last=False)
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove cached speech {path}: {str(e)}")
+
+    def _render(self, engine, key, text, voice, rate):
+        path = os.path.join(self.cache_dir, key + AUDIO_EXTENSION)
+        # Render to a temporary name so a half-written file is never served
+        tmp_path = path + '.tmp'
+        engine.setProperty('voice', voice or engine.getProperty('voices')[0].id)
+        engine.setProperty('rate', rate)
+        engine.save_to_file(text, tmp_path)
+        engine.runAndWait()
+        if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
+            raise RuntimeError("Speech engine produced no audio")
+        os.replace(tmp_path, path)
+        return path
+
+    def _run(self):
+        engine = None
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            key, text, voice, rate = job
+            try:
+                if engine is None:
+                    import pyttsx3
+                    engine = pyttsx3.init()
+                path = self._render(engine, key, text, voice, rate)
+            except Exception as e:
+                logger.error(f"Error in speech engine: {str(e)}")
+                # The driver may be left in a bad state; start a fresh engine for the next job
+                engine = None
+                with self.lock:
+                    self.pending.discard(key)
+                    self.errors[key] = str(e)
+                    # Keep only recent failures around for status()
+                    while len(self.errors) > self.cache_size:
+                        self.errors.pop(next(iter(self.errors)))
+                continue
+            with self.lock:
+                self.pending.discard(key)
+                self.cache[key] = path
+                self.cache.move_to_end(key)
+                self._evict()
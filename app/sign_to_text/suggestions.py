@@ -0,0 +1,89 @@
+"""Word suggestions for the partially spelled word, off the frame path.
+
+Enchant lookups take milliseconds to tens of milliseconds, while the current
+word only changes a few times per second, so results are memoized per word
+in an LRU cache and computed on a single worker thread. Frames never wait on
+a lookup: a cache miss returns None and the caller is notified once the
+suggestions are ready.
+"""
+from collections import OrderedDict
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+NUM_SUGGESTIONS = 4
+
+
+class SuggestionService:
+    def __init__(self, dictionary, lock=None, cache_size=1024):
+        self.dictionary = dictionary
+        # Enchant dictionaries are not thread-safe; share the lock with any other users
+        self.dictionary_lock = lock or threading.Lock()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.pending = {}  # word -> callbacks waiting for it
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.worker = threading.Thread(target=self._run, name='suggestions', daemon=True)
+        self.worker.start()
+
+    def lookup(self, word, callback=None):
+        """Cached suggestions for word, or None after queueing a lookup that ends in callback(word, suggestions)."""
+        with self.lock:
+            suggestions = self.cache.get(word)
+            if suggestions is not None:
+                self.cache.move_to_end(word)
+                return suggestions
+            callbacks = self.pending.get(word)
+            if callbacks is None:
+                self.pending[word] = callbacks = []
+                self.queue.put(word)
+            # A caller asking again while the lookup is queued is still notified only once
+            if callback is not None and callback not in callbacks:
+                callbacks.append(callback)
+        return None
+
+    def suggest(self, word):
+        """Blocking lookup through the same cache, for callers off the frame path."""
+        suggestions = self.lookup(word)
+        if suggestions is None:
+            suggestions = self._compute(word)
+            self._store(word, suggestions)
+        return suggestions
+
+    def stop(self):
+        self.queue.put(None)
+
+    def _compute(self, word):
+        with self.dictionary_lock:
+            suggestions = self.dictionary.suggest(word)[:NUM_SUGGESTIONS]
+        # Always four slots so callers can assign them positionally
+        return tuple(suggestions) + (" ",) * (NUM_SUGGESTIONS - len(suggestions))
+
+    def _store(self, word, suggestions):
+        with self.lock:
+            self.cache[word] = suggestions
+            self.cache.move_to_end(word)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            return self.pending.pop(word, [])
+
+    def _run(self):
+        while True:
+            word = self.queue.get()
+            if word is None:
+                return
+            try:
+                suggestions = self._compute(word)
+            except Exception as e:
+                logger.error(f"Error computing suggestions for {word!r}: {str(e)}")
+                with self.lock:
+                    self.pending.pop(word, None)
+                continue
+            for callback in self._store(word, suggestions):
+                try:
+                    callback(word, suggestions)
+                except Exception as e:
+                    logger.error(f"Error in suggestion callback: {str(e)}")
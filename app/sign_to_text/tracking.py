@@ -0,0 +1,104 @@
+"""Hand region-of-interest tracking between full-frame detections.
+
+After the hand has been found, the next frame's hand box is predicted from
+its recent motion and only that square region, resampled to a fixed size
+(and padded where the frame edge cuts it off), is passed to MediaPipe. A full-frame search runs every `redetect_every`
+frames, and whenever the hand is not found in the region or its box
+touches the region border or jumps in size.
+"""
+import numpy as np
+import cv2
+
+# Side of the resampled region passed to MediaPipe, in pixels
+ROI_SIZE = 256
+
+
+class HandTracker:
+    def __init__(self, redetect_every=10, margin=0.35, alpha=0.5, roi_size=ROI_SIZE):
+        self.redetect_every = redetect_every
+        self.margin = margin  # padding around the predicted box, as a fraction of its size per side
+        self.alpha = alpha  # EMA weight of the newest motion estimate
+        self.roi_size = roi_size
+        self.reset()
+
+    def reset(self):
+        self.bbox = None
+        self.velocity = np.zeros(2, dtype=np.float32)
+        self.since_full = 0
+
+    def predict_roi(self, shape):
+        """Square (x1, y1, x2, y2) region expected to contain the hand, or None to search the full frame."""
+        if self.bbox is None or self.since_full >= self.redetect_every:
+            return None
+        x, y, w, h = self.bbox
+        cx, cy = x + w / 2 + self.velocity[0], y + h / 2 + self.velocity[1]
+        # Faster motion means more uncertainty about where the hand ends up
+        half = max(w, h) * (0.5 + self.margin) + float(np.abs(self.velocity).max())
+        x1, y1 = max(0, int(cx - half)), max(0, int(cy - half))
+        x2, y2 = min(shape[1], int(cx + half)), min(shape[0], int(cy + half))
+        if x2 - x1 < 32 or y2 - y1 < 32:
+            return None
+        return x1, y1, x2, y2
+
+    def update(self, bbox, full):
+        """Record where the hand was found; full says whether this came from a full-frame search."""
+        if self.bbox is not None:
+            x, y, w, h = self.bbox
+            nx, ny, nw, nh = bbox
+            motion = np.array([nx + nw / 2 - x - w / 2, ny + nh / 2 - y - h / 2], dtype=np.float32)
+            self.velocity += self.alpha * (motion - self.velocity)
+        self.bbox = tuple(bbox)
+        self.since_full = 0 if full else self.since_full + 1
+
+    def lost(self):
+        self.reset()
+
+    def confident(self, bbox, roi):
+        """Whether a box found in roi can be trusted: clear of the region border and of plausible size."""
+        x, y, w, h = bbox
+        x1, y1, x2, y2 = roi
+        edge = 2
+        if x <= x1 + edge or y <= y1 + edge or x + w >= x2 - edge or y + h >= y2 - edge:
+            return False
+        if self.bbox is not None:
+            ratio = max(w, h) / max(1, max(self.bbox[2], self.bbox[3]))
+            if not 0.6 <= ratio <= 1.6:
+                return False
+        return True
+
+    def crop(self, image, roi):
+        """roi as a roi_size square; returns (crop, x0, y0, scale), frame point = (x0, y0) + crop point * scale.
+
+        A region clipped by the frame edge is padded back to a square with
+        black rather than stretched, so the hand keeps its proportions.
+        """
+        x1, y1, x2, y2 = roi
+        w, h = x2 - x1, y2 - y1
+        side = max(w, h)
+        region = image[y1:y2, x1:x2]
+        # Pad on the clipped side, where the square would have extended past the frame
+        left = side - w if x1 == 0 else 0
+        top = side - h if y1 == 0 else 0
+        if w != h:
+            region = cv2.copyMakeBorder(region, top, side - h - top, left, side - w - left, cv2.BORDER_CONSTANT)
+        return cv2.resize(region, (self.roi_size, self.roi_size)), x1 - left, y1 - top, side / self.roi_size
+
+    def detect(self, hd, image, roi):
+        """Run hd on the resampled roi; returns a hand dict in frame coordinates (lmList, bbox) or None."""
+        crop, x0, y0, scale = self.crop(image, roi)
+        hands = hd.findHands(crop, draw=False, flipType=True)
+        if not (hands and hands[0]):
+            return None
+
+        # cvzone scales z like x, so all three go back to frame pixels together
+        lm = np.asarray(hands[0][0]['lmList'], dtype=np.float32) * scale
+        lm[:, 0] += x0
+        lm[:, 1] += y0
+        lm = np.rint(lm).astype(int)
+        # Same box cvzone derives from the landmarks
+        xmin, ymin = lm[:, :2].min(axis=0)
+        xmax, ymax = lm[:, :2].max(axis=0)
+        bbox = (int(xmin), int(ymin), int(xmax - xmin), int(ymax - ymin))
+        if not self.confident(bbox, roi):
+            return None
+        return {'lmList': lm.tolist(), 'bbox': bbox}
@@ -0,0 +1,103 @@
+"""Train the landmark-vector classifier and export it for LandmarkClassifier.
+
+Usage:
+    python -m app.sign_to_text.train_landmarks DATA [DATA ...] --output app/models/landmark_mlp.npz
+
+Each DATA is either an .npz with 'landmarks' (N, 21, 2|3) and 'labels' (N,)
+gesture-group ids, or a directory with one sub-directory per group id
+(0-7) containing hand images, from which landmarks are extracted with
+the same HandDetector settings the live pipeline uses.
+"""
+import argparse
+import logging
+import os
+import numpy as np
+
+from app.sign_to_text.landmarks import landmark_features, FEATURE_SIZE
+
+logger = logging.getLogger(__name__)
+
+NUM_GROUPS = 8
+
+
+def load_npz(path):
+    with np.load(path) as data:
+        return list(data['landmarks']), list(data['labels'].astype(np.int64))
+
+
+def load_image_dir(path):
+    import cv2
+    from cvzone.HandTrackingModule import HandDetector
+
+    hd = HandDetector(staticMode=True, maxHands=1, detectionCon=0.7)
+    landmarks, labels = [], []
+    for group in sorted(os.listdir(path)):
+        group_dir = os.path.join(path, group)
+        if not (os.path.isdir(group_dir) and group.isdigit()):
+            continue
+        for name in sorted(os.listdir(group_dir)):
+            image = cv2.imread(os.path.join(group_dir, name))
+            if image is None:
+                continue
+            hands = hd.findHands(image, draw=False, flipType=True)
+            if hands and hands[0]:
+                landmarks.append(hands[0][0]['lmList'])
+                labels.append(int(group))
+    return landmarks, labels
+
+
+def build_dataset(paths):
+    landmarks, labels = [], []
+    for path in paths:
+        pts, y = load_npz(path) if path.endswith('.npz') else load_image_dir(path)
+        logger.info(f"{path}: {len(y)} samples")
+        landmarks.extend(pts)
+        labels.extend(y)
+    if not landmarks:
+        return np.empty((0, FEATURE_SIZE), dtype=np.float32), np.empty(0, dtype=np.int64)
+    X = np.stack([landmark_features(pts) for pts in landmarks])
+    return X, np.asarray(labels, dtype=np.int64)
+
+
+def train(X, y, hidden=(64, 32), epochs=60, seed=0):
+    import tensorflow as tf
+
+    tf.random.set_seed(seed)
+    mean = X.mean(axis=0)
+    std = X.std(axis=0) + 1e-6
+
+    model = tf.keras.Sequential([tf.keras.Input(shape=(FEATURE_SIZE,))] +
+                                [tf.keras.layers.Dense(units, activation='relu') for units in hidden] +
+                                [tf.keras.layers.Dense(NUM_GROUPS, activation='softmax')])
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    model.fit((X - mean) / std, y, epochs=epochs, batch_size=64, validation_split=0.1, shuffle=True, verbose=2)
+
+    weights = {'mean': mean, 'std': std}
+    dense = [layer for layer in model.layers if isinstance(layer, tf.keras.layers.Dense)]
+    for i, layer in enumerate(dense):
+        W, b = layer.get_weights()
+        weights[f'W{i}'] = W
+        weights[f'b{i}'] = b
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the landmark-vector sign classifier")
+    parser.add_argument('data', nargs='+', help=".npz datasets or directories of images grouped by class id")
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                         'models', 'landmark_mlp.npz'))
+    parser.add_argument('--hidden', default='64,32', help="Comma-separated hidden layer sizes")
+    parser.add_argument('--epochs', type=int, default=60)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    X, y = build_dataset(args.data)
+    if not len(y):
+        parser.error("No training samples found")
+    weights = train(X, y, hidden=tuple(int(h) for h in args.hidden.split(',')), epochs=args.epochs)
+    np.savez(args.output, **weights)
+    logger.info(f"Saved landmark model to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 let lastSpeakTime = 0;
 const speakCooldown = 1000; // 1 second cooldown
+const speechPollInterval = 250; // ms between checks for rendered speech
+const speechPollLimit = 120;     // give up after about 30 seconds
 let updateInterval = null;
 const errorMessageTimeout = 3000; // 3 seconds
 let retryCount = 0;
@@ -9,6 +11,13 @@ let lastFrameTime = 0;
 const minFrameInterval = 25; // Minimum 25ms between frames (40 FPS max)
 let connectionLost = false;
 let frameRequestPending = false;
+let eventSource = null;  // Server-Sent Events channel for recognition updates
+let streaming = false;   // True while the MJPEG stream + SSE transport is active
+let localStream = null;  // Browser camera stream when frames are uploaded to the server
+let uploading = false;
+const uploadWidth = 640;
+const uploadQuality = 0.8;
+let stateVersion = null;  // Last recognition state version received; the server omits unchanged fields
 
 const geminiApiKey = "" // Replace with your actual Gemini API key
 
@@ -98,6 +107,41 @@ function showError(message, duration = errorMessageTimeout) {
     }, duration);
 }
 
+function updateRecognition(data) {
+    // Update current symbol and sentence
+    document.getElementById('current-symbol').textContent = data.current_symbol || '-';
+    document.getElementById('sentence').textContent = data.sentence || '-';
+}
+
+function previewTier() {
+    // Request only as many preview pixels as the video box can show
+    const container = document.getElementById('video-feed').parentElement;
+    const width = container.clientWidth * (window.devicePixelRatio || 1);
+    if (width && width <= 360) {
+        return 'low';
+    }
+    if (width && width <= 520) {
+        return 'medium';
+    }
+    return 'high';
+}
+
+function frameUrl(path, params = {}) {
+    if (stateVersion !== null) {
+        params.since = stateVersion;
+    }
+    return `${path}?${new URLSearchParams(params)}`;
+}
+
+function handleRecognition(data) {
+    if (data.version !== undefined) {
+        stateVersion = data.version;
+    }
+    if (!data.unchanged) {
+        updateRecognition(data);
+    }
+}
+
 function updateFrame() {
     const currentTime = performance.now();
     if (frameRequestPending || (currentTime - lastFrameTime) < minFrameInterval) {
@@ -106,7 +150,7 @@ function updateFrame() {
     }
 
     frameRequestPending = true;
-    fetch('/sign_to_text/video_feed')
+    fetch(frameUrl('/sign_to_text/video_feed', { preview: previewTier() }))
         .then(response => {
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
@@ -144,14 +188,13 @@ function updateFrame() {
                 if (errorElement.textContent.includes("Connection error")) {
                     errorElement.style.display = 'none';
                 }
-            } else {
+            } else if (data.error && data.error !== "Frame skipped") {
+                // No new frame on skipped or reused results; keep showing the last one
                 videoFeed.style.display = 'none';
                 placeholder.style.display = 'flex';
             }
 
-            // Update current symbol and sentence
-            document.getElementById('current-symbol').textContent = data.current_symbol || '-';
-            document.getElementById('sentence').textContent = data.sentence || '-';
+            handleRecognition(data);
         })
         .catch(error => {
             console.error('Error:', error);
@@ -173,13 +216,159 @@ function updateFrame() {
         });
 }
 
+function isFeedRunning() {
+    return streaming || uploading || updateInterval !== null;
+}
+
+function getFrameSource() {
+    const container = document.getElementById('sign-to-text');
+    return (container && container.dataset.frameSource) || 'camera';
+}
+
+async function startUpload() {
+    const localVideo = document.getElementById('local-video');
+    const placeholder = document.getElementById('video-placeholder');
+    uploading = true;
+    stateVersion = null;
+
+    try {
+        localStream = await navigator.mediaDevices.getUserMedia({
+            video: { width: { ideal: 640 }, height: { ideal: 480 } },
+            audio: false
+        });
+    } catch (error) {
+        console.error('Camera access denied:', error);
+        uploading = false;
+        showError("Camera access is required for sign recognition.", 0);
+        placeholder.style.display = 'flex';
+        return;
+    }
+    if (!uploading) {
+        // Stopped while waiting for camera permission
+        localStream.getTracks().forEach(track => track.stop());
+        localStream = null;
+        return;
+    }
+
+    // The browser renders its own preview; only compressed frames go to the server
+    localVideo.srcObject = localStream;
+    localVideo.style.display = 'block';
+    document.getElementById('video-feed').style.display = 'none';
+    placeholder.style.display = 'none';
+
+    const canvas = document.createElement('canvas');
+    const context = canvas.getContext('2d');
+
+    const sendFrame = () => {
+        if (!uploading) {
+            return;
+        }
+        if (!localVideo.videoWidth) {
+            setTimeout(sendFrame, minFrameInterval);
+            return;
+        }
+        canvas.width = uploadWidth;
+        canvas.height = Math.round(uploadWidth * localVideo.videoHeight / localVideo.videoWidth);
+        context.drawImage(localVideo, 0, 0, canvas.width, canvas.height);
+
+        canvas.toBlob(blob => {
+            // Keep exactly one upload in flight so frames never queue up
+            fetch(frameUrl('/sign_to_text/ingest'), {
+                method: 'POST',
+                headers: { 'Content-Type': 'image/jpeg' },
+                body: blob
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.error) {
+                    showError(data.error);
+                }
+                handleRecognition(data);
+            })
+            .catch(error => {
+                console.error('Error uploading frame:', error);
+            })
+            .finally(() => setTimeout(sendFrame, minFrameInterval));
+        }, 'image/jpeg', uploadQuality);
+    };
+    sendFrame();
+}
+
+function stopUpload() {
+    uploading = false;
+    if (localStream) {
+        localStream.getTracks().forEach(track => track.stop());
+        localStream = null;
+    }
+    const localVideo = document.getElementById('local-video');
+    localVideo.srcObject = null;
+    localVideo.style.display = 'none';
+}
+
+function startStream() {
+    const videoFeed = document.getElementById('video-feed');
+    const placeholder = document.getElementById('video-placeholder');
+    streaming = true;
+
+    // Recognition fields are pushed only when they change
+    eventSource = new EventSource('/sign_to_text/events');
+    eventSource.onmessage = (event) => updateRecognition(JSON.parse(event.data));
+    eventSource.onerror = () => {
+        // EventSource retries on its own; give up only once it has closed for good
+        if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+            fallBackToPolling();
+        }
+    };
+
+    // The browser decodes the multipart MJPEG stream natively
+    videoFeed.onerror = () => {
+        if (streaming) {
+            fallBackToPolling();
+        }
+    };
+    videoFeed.src = `/sign_to_text/video_stream?preview=${previewTier()}`;
+    videoFeed.style.display = 'block';
+    placeholder.style.display = 'none';
+}
+
+function stopStream() {
+    streaming = false;
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+    const videoFeed = document.getElementById('video-feed');
+    videoFeed.onerror = null;
+    videoFeed.removeAttribute('src');  // Closes the MJPEG connection
+}
+
+function fallBackToPolling() {
+    console.warn('Streaming transport unavailable, falling back to polling');
+    stopStream();
+    startPolling();
+}
+
 function startVideoFeed() {
+    if (isFeedRunning()) {
+        return;
+    }
+    if (getFrameSource() === 'browser') {
+        startUpload();
+    } else if (window.EventSource) {
+        startStream();
+    } else {
+        startPolling();
+    }
+}
+
+function startPolling() {
     if (!updateInterval) {
         // Reset state
         retryCount = 0;
         connectionLost = false;
         frameRequestPending = false;
         lastFrameTime = 0;
+        stateVersion = null;
         
         // Start update loop
         updateFrame();
@@ -188,9 +377,13 @@ function startVideoFeed() {
 }
 
 function stopVideoFeed() {
-    if (updateInterval) {
-        clearInterval(updateInterval);
-        updateInterval = null;
+    if (isFeedRunning()) {
+        stopStream();
+        stopUpload();
+        if (updateInterval) {
+            clearInterval(updateInterval);
+            updateInterval = null;
+        }
         
         // Call backend to release camera
         fetch('/sign_to_text/release_camera', {
@@ -211,7 +404,7 @@ function stopVideoFeed() {
 function toggleVideoFeed() {
     const toggleBtn = document.getElementById('video-toggle-btn');
     
-    if (updateInterval) {
+    if (isFeedRunning()) {
         // Video is currently running, so stop it
         stopVideoFeed();
         toggleBtn.textContent = 'Start Video';
@@ -264,13 +457,44 @@ function speak() {
     .then(data => {
         if (!data.success) {
             console.error('Speech error:', data.error);
+            return;
         }
+        playSpeech(data.audio_url, speechPollLimit);
     })
     .catch(error => {
         console.error('Error:', error);
     });
 }
 
+// Audio is rendered on the server's speech worker; poll until it is ready, then play it here
+function playSpeech(url, attemptsLeft) {
+    fetch(url)
+    .then(response => {
+        if (response.status === 202) {
+            if (attemptsLeft > 0) {
+                setTimeout(() => playSpeech(url, attemptsLeft - 1), speechPollInterval);
+            } else {
+                console.error('Speech error: synthesis timed out');
+            }
+            return null;
+        }
+        if (!response.ok) {
+            return response.json().then(data => { throw new Error(data.error); });
+        }
+        return response.blob();
+    })
+    .then(blob => {
+        if (!blob) return;
+        const audioUrl = URL.createObjectURL(blob);
+        const audio = new Audio(audioUrl);
+        audio.onended = () => URL.revokeObjectURL(audioUrl);
+        return audio.play();
+    })
+    .catch(error => {
+        console.error('Speech error:', error);
+    });
+}
+
 function clearSentence() {
     fetch('/sign_to_text/clear', {
         method: 'POST',
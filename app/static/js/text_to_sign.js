@@ -11,14 +11,15 @@ function record() {
 
 // Video player functionality
 var words = JSON.parse(document.querySelector('[data-words-list]').dataset.wordsList || '[]');
+// Clip URLs resolved by the server's asset index, in playback order
+var clips = JSON.parse(document.querySelector('[data-clips-list]').dataset.clipsList || '[]');
 var i = 0;
 var videoPlayer = document.getElementById("videoPlayer");
 
 function play() {
-    if (i < words.length) {
-        var file = words[i] + ".mp4";
-        console.log("Playing video:", file);
-        videoPlayer.src = `/static/assets/${file}`;
+    if (i < clips.length) {
+        console.log("Playing video:", clips[i]);
+        videoPlayer.src = clips[i];
         videoPlayer.play();
         i++;
         videoPlayer.addEventListener('ended', play);
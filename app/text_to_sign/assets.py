@@ -0,0 +1,89 @@
+"""In-memory index of the sign animation clips in static/assets.
+
+Built with one directory scan and looked up case-insensitively, so
+resolving a sentence needs no filesystem calls. The directory's mtime is
+checked at most every check_interval seconds and the index rebuilt when
+clips were added, removed or renamed.
+"""
+from collections import namedtuple
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# name: clip name as spelled on disk ("Hello"); filename: "Hello.mp4"
+Asset = namedtuple('Asset', ['name', 'filename', 'path', 'size', 'mtime'])
+
+
+def normalize(word):
+    """Lookup key: case-folded, with runs of whitespace collapsed ("do  NOT" -> "do not")."""
+    return ' '.join(word.split()).casefold()
+
+
+class AssetIndex:
+    def __init__(self, directory, extension='.mp4', check_interval=2.0):
+        self.directory = directory
+        self.extension = extension
+        self.check_interval = check_interval
+        self.assets = {}
+        self.version = 0  # bumped on every rebuild, so callers can invalidate what they derived
+        self.dir_mtime = None
+        self.checked = 0.0
+        self.lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Rescan the directory and swap in the new index."""
+        assets = {}
+        try:
+            dir_mtime = os.stat(self.directory).st_mtime
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext.lower() != self.extension or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    key = normalize(name)
+                    if key in assets:
+                        logger.warning(f"Clips {assets[key].filename} and {entry.name} differ only in case; "
+                                       f"using {assets[key].filename}")
+                        continue
+                    assets[key] = Asset(name, entry.name, entry.path, stat.st_size, stat.st_mtime)
+        except OSError as e:
+            logger.error(f"Error indexing sign assets in {self.directory}: {str(e)}")
+            dir_mtime = None
+        with self.lock:
+            self.assets = assets
+            self.version += 1
+            self.dir_mtime = dir_mtime
+            self.checked = time.monotonic()
+        logger.info(f"Indexed {len(assets)} sign clips in {self.directory}")
+
+    def check(self):
+        """Rebuild the index if the directory changed (checked at most every check_interval seconds)."""
+        now = time.monotonic()
+        if now - self.checked < self.check_interval:
+            return
+        with self.lock:
+            if now - self.checked < self.check_interval:
+                return
+            self.checked = now
+        try:
+            changed = os.stat(self.directory).st_mtime != self.dir_mtime
+        except OSError:
+            changed = self.dir_mtime is not None
+        if changed:
+            self.refresh()
+
+    def lookup(self, word):
+        """The Asset for word in any letter case, or None."""
+        self.check()
+        return self.assets.get(normalize(word))
+
+    def __contains__(self, word):
+        return self.lookup(word) is not None
+
+    def __len__(self):
+        return len(self.assets)
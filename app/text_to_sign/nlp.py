@@ -0,0 +1,178 @@
+"""English sentence to sign-clip sequence, with the NLTK models loaded once per process.
+
+Stop words, the lemmatizer and the POS tagger are created once and warmed
+up (NLTK loads the tagger and WordNet lazily on first use, which takes
+seconds). Final word/letter sequences are memoized per normalized
+sentence in an LRU cache, so repeated lesson sentences skip NLTK entirely.
+"""
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+from nltk.tokenize import word_tokenize
+from nltk.stem import WordNetLemmatizer
+import nltk
+
+logger = logging.getLogger(__name__)
+
+# Stopwords that will be removed
+STOP_WORDS = frozenset(["mightn't", 're', 'wasn', 'wouldn', 'be', 'has', 'that', 'does', 'shouldn', 'do', "you've",
+                        'off', 'for', "didn't", 'm', 'ain', 'haven', "weren't", 'are', "she's", "wasn't", 'its',
+                        "haven't", "wouldn't", 'don', 'weren', 's', "you'd", "don't", 'doesn', "hadn't", 'is', 'was',
+                        "that'll", "should've", 'a', 'then', 'the', 'mustn', 'i', 'nor', 'as', "it's", "needn't",
+                        'd', 'am', 'have',  'hasn', 'o', "aren't", "you'll", "couldn't", "you're", "mustn't", 'didn',
+                        "doesn't", 'll', 'an', 'hadn', 'whom', 'y', "hasn't", 'itself', 'couldn', 'needn', "shan't",
+                        'isn', 'been', 'such', 'shan', "shouldn't", 'aren', 'being', 'were', 'did', 'ma', 't',
+                        'having', 'mightn', 've', "isn't", "won't"])
+
+
+def normalize_sentence(text):
+    """Cache key: lower-cased, with runs of whitespace collapsed."""
+    return ' '.join(text.lower().split())
+
+
+class GlossPipeline:
+    """Sentence -> tuple of (word or letter, Asset or None) in playback order."""
+
+    def __init__(self, assets, cache_size=1024):
+        self.assets = assets
+        self.lemmatizer = WordNetLemmatizer()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # NLTK's lazy corpus loaders are not safe to trigger from several threads at once
+        self.load_lock = threading.Lock()
+        self.loaded = False
+
+    def warm_up(self):
+        """Load the tokenizer, tagger and WordNet now rather than on the first request."""
+        with self.load_lock:
+            if self.loaded:
+                return
+            start = time.perf_counter()
+            tagged = nltk.pos_tag(word_tokenize("i was running to the better place"))
+            for w, p in tagged:
+                self._lemmatize(w, p)
+            self.loaded = True
+        logger.info(f"Text-to-sign NLP warm-up finished in {time.perf_counter() - start:.2f}s")
+
+    def translate(self, text):
+        """Clip sequence for one sentence, from the cache when possible."""
+        # The index version invalidates cached sequences once clips are added or renamed
+        self.assets.check()
+        key = (normalize_sentence(text), self.assets.version)
+        with self.lock:
+            sequence = self.cache.get(key)
+            if sequence is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return sequence
+            self.misses += 1
+
+        self.warm_up()
+        words = word_tokenize(key[0])
+        sequence = self.resolve(self.glosses(words, nltk.pos_tag(words)))
+        self._store(key, sequence)
+        return sequence
+
+    def translate_many(self, texts):
+        """Clip sequences for many sentences, with one pos_tag_sents() call over all cache misses.
+
+        Returns a list of (sequence, cached) in input order; duplicate sentences are translated once.
+        """
+        self.assets.check()
+        version = self.assets.version
+        keys = [(normalize_sentence(text), version) for text in texts]
+        found = {}
+        with self.lock:
+            for key in keys:
+                sequence = self.cache.get(key)
+                if sequence is not None:
+                    self.cache.move_to_end(key)
+                    self.hits += 1
+                    found[key] = sequence
+            missing = list(dict.fromkeys(key for key in keys if key not in found))
+            self.misses += len(missing)
+
+        results = [(found[key], True) if key in found else None for key in keys]
+        if missing:
+            self.warm_up()
+            tokens = [word_tokenize(key[0]) for key in missing]
+            # Clip lookups are shared across the batch, since lesson sentences repeat most words
+            lookups = {}
+            for key, words, tagged in zip(missing, tokens, nltk.pos_tag_sents(tokens)):
+                found[key] = self.resolve(self.glosses(words, tagged), lookups)
+                self._store(key, found[key])
+            results = [result or (found[key], False) for result, key in zip(results, keys)]
+        return results
+
+    def stats(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.cache),
+                    'capacity': self.cache_size, 'loaded': self.loaded}
+
+    def _store(self, key, sequence):
+        with self.lock:
+            self.cache[key] = sequence
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def _lemmatize(self, w, tag):
+        if tag in ['VBG', 'VBD', 'VBZ', 'VBN', 'NN']:
+            return self.lemmatizer.lemmatize(w, pos='v')
+        elif tag in ['JJ', 'JJR', 'JJS', 'RBR', 'RBS']:
+            return self.lemmatizer.lemmatize(w, pos='a')
+        return self.lemmatizer.lemmatize(w)
+
+    def glosses(self, words, tagged):
+        """Sign words for a tokenized, POS-tagged sentence: stop words dropped, lemmatized, tense marker added."""
+        tense = {}
+        tense["future"] = len([word for word in tagged if word[1] == "MD"])
+        tense["present"] = len([word for word in tagged if word[1] in ["VBP", "VBZ","VBG"]])
+        tense["past"] = len([word for word in tagged if word[1] in ["VBD", "VBN"]])
+        tense["present_continuous"] = len([word for word in tagged if word[1] in ["VBG"]])
+
+        # Removing stopwords and applying lemmatizing nlp process to words
+        filtered_text = [self._lemmatize(w, p[1]) for w, p in zip(words, tagged) if w not in STOP_WORDS]
+
+        # Adding the specific word to specify tense
+        words = ['Me' if w == 'I' else w for w in filtered_text]
+        probable_tense = max(tense, key=tense.get)
+
+        if probable_tense == "past" and tense["past"] >= 1:
+            words = ["Before"] + words
+        elif probable_tense == "future" and tense["future"] >= 1:
+            if "Will" not in words:
+                words = ["Will"] + words
+        elif probable_tense == "present":
+            if tense["present_continuous"] >= 1:
+                words = ["Now"] + words
+        return words
+
+    def resolve(self, words, lookups=None):
+        """Pair each word with its clip, spelling out words that have none letter by letter.
+
+        lookups memoizes clip lookups across calls (e.g. over one batch).
+        """
+        def memoized(word):
+            if word not in lookups:
+                lookups[word] = self.assets.lookup(word)
+            return lookups[word]
+        lookup = memoized if lookups is not None else self.assets.lookup
+
+        sequence = []
+        for w in words:
+            asset = lookup(w)
+            # Splitting the word if its animation is not present in database
+            if asset is None:
+                for c in w:
+                    letter = lookup(c)
+                    sequence.append((letter.name if letter else c, letter))
+            # Otherwise animation of word, named as on disk
+            else:
+                sequence.append((asset.name, asset))
+        return tuple(sequence)
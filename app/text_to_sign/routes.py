@@ -1,8 +1,9 @@
-from flask import render_template, request, current_app
+from flask import render_template, request, current_app, url_for, jsonify
 from app.text_to_sign import text_to_sign_bp
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
-import nltk
+from app.text_to_sign.assets import AssetIndex
+from app.text_to_sign.nlp import GlossPipeline
+import threading
+import logging
 import os
 # from num2words import num2words
 
@@ -10,11 +11,32 @@ import os
 text_to_sign_bp.static_folder = '../static/assets'  # Going up one level from text_to_sign to reach static/assets
 text_to_sign_bp.static_url_path = '/static/assets'  # URL path that will be used to access static files
 
-def find_static_file(path):
-    static_file = os.path.join(current_app.root_path, 'static/assets', path)
-    if os.path.exists(static_file):
-        return static_file
-    return None
+logger = logging.getLogger(__name__)
+
+# Clip index built once at startup; lookups are case-insensitive and never touch the disk
+assets = None
+# Process-wide NLP pipeline with a sentence -> clip sequence cache
+pipeline = None
+
+@text_to_sign_bp.record_once
+def init_assets(state):
+    global assets, pipeline
+    config = state.app.config
+    assets = AssetIndex(os.path.join(state.app.root_path, 'static', 'assets'),
+                        check_interval=config['TEXT_TO_SIGN_ASSET_CHECK_S'])
+    pipeline = GlossPipeline(assets, cache_size=config['TEXT_TO_SIGN_CACHE_SIZE'])
+    if config['TEXT_TO_SIGN_WARMUP']:
+        threading.Thread(target=warm_up, name='text-to-sign-warmup', daemon=True).start()
+
+def warm_up():
+    try:
+        pipeline.warm_up()
+    except Exception as e:
+        # Not fatal: the first request loads the models instead
+        logger.error(f"Error warming up text-to-sign NLP: {str(e)}")
+
+def clip_url(asset):
+    return url_for('static', filename='assets/' + asset.filename)
 
 # Import any additional Flask extensions you need
 # from flask_sqlalchemy import SQLAlchemy
@@ -50,81 +72,57 @@ def animation_view():
     if request.method == 'POST':
         text = request.form.get('sen', '')
         text = text.lower()
-        
-        # Tokenizing the sentence
-        words = word_tokenize(text)
-        
-        tagged = nltk.pos_tag(words)
-        tense = {}
-        tense["future"] = len([word for word in tagged if word[1] == "MD"])
-        tense["present"] = len([word for word in tagged if word[1] in ["VBP", "VBZ","VBG"]])
-        tense["past"] = len([word for word in tagged if word[1] in ["VBD", "VBN"]])
-        tense["present_continuous"] = len([word for word in tagged if word[1] in ["VBG"]])
-
-        # Stopwords that will be removed
-        stop_words = set(["mightn't", 're', 'wasn', 'wouldn', 'be', 'has', 'that', 'does', 'shouldn', 'do', "you've",
-                         'off', 'for', "didn't", 'm', 'ain', 'haven', "weren't", 'are', "she's", "wasn't", 'its', 
-                         "haven't", "wouldn't", 'don', 'weren', 's', "you'd", "don't", 'doesn', "hadn't", 'is', 'was', 
-                         "that'll", "should've", 'a', 'then', 'the', 'mustn', 'i', 'nor', 'as', "it's", "needn't", 
-                         'd', 'am', 'have',  'hasn', 'o', "aren't", "you'll", "couldn't", "you're", "mustn't", 'didn', 
-                         "doesn't", 'll', 'an', 'hadn', 'whom', 'y', "hasn't", 'itself', 'couldn', 'needn', "shan't", 
-                         'isn', 'been', 'such', 'shan', "shouldn't", 'aren', 'being', 'were', 'did', 'ma', 't', 
-                         'having', 'mightn', 've', "isn't", "won't"])
-
-        # Removing stopwords and applying lemmatizing nlp process to words
-        lr = WordNetLemmatizer()
-        filtered_text = []
-        for w, p in zip(words, tagged):
-            if w not in stop_words:
-                if p[1] in ['VBG', 'VBD', 'VBZ', 'VBN', 'NN']:
-                    filtered_text.append(lr.lemmatize(w, pos='v'))
-                elif p[1] in ['JJ', 'JJR', 'JJS', 'RBR', 'RBS']:
-                    filtered_text.append(lr.lemmatize(w, pos='a'))
-                else:
-                    filtered_text.append(lr.lemmatize(w))
-
-        # Adding the specific word to specify tense
-        words = filtered_text
-        temp = []
-        for w in words:
-            if w == 'I':
-                temp.append('Me')
-            else:
-                temp.append(w)
-        words = temp
-        probable_tense = max(tense, key=tense.get)
-
-        if probable_tense == "past" and tense["past"] >= 1:
-            temp = ["Before"]
-            temp = temp + words
-            words = temp
-        elif probable_tense == "future" and tense["future"] >= 1:
-            if "Will" not in words:
-                temp = ["Will"]
-                temp = temp + words
-                words = temp
-        elif probable_tense == "present":
-            if tense["present_continuous"] >= 1:
-                temp = ["Now"]
-                temp = temp + words
-                words = temp
-
-        filtered_text = []
-        for w in words:
-            path = w + ".mp4"
-            f = find_static_file(path)
-            # Splitting the word if its animation is not present in database
-            if not f:
-                for c in w:
-                    filtered_text.append(c)
-            # Otherwise animation of word
-            else:
-                filtered_text.append(w)
-        words = filtered_text
-
-        return render_template('text_to_sign/index.html', words=words if words else [], text=text)
+
+        # Warm NLP pipeline; repeated sentences come straight from its cache
+        sequence = pipeline.translate(text)
+        words = [word for word, _ in sequence]
+        clips = [clip_url(asset) for _, asset in sequence if asset is not None]
+
+        return render_template('text_to_sign/index.html', words=words if words else [], clips=clips, text=text)
     else:
-        return render_template('text_to_sign/index.html', words=[], text='')
+        return render_template('text_to_sign/index.html', words=[], clips=[], text='')
+
+@text_to_sign_bp.route('/api/translate', methods=['POST'])
+def translate_api():
+    """Translate many sentences in one call.
+
+    Body: {"sentences": ["...", ...]}. Each result lists the sign words/letters in
+    playback order with their clip URL (null when there is no clip).
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        sentences = data.get('sentences')
+        if not isinstance(sentences, list) or not all(isinstance(s, str) for s in sentences):
+            return jsonify({'success': False, 'error': 'sentences must be a list of strings'}), 400
+        max_batch = current_app.config['TEXT_TO_SIGN_MAX_BATCH']
+        if len(sentences) > max_batch:
+            return jsonify({'success': False, 'error': f'At most {max_batch} sentences per request'}), 413
+
+        # Built once per distinct clip rather than once per occurrence
+        urls = {}
+        def url(asset):
+            if asset is None:
+                return None
+            if asset.filename not in urls:
+                urls[asset.filename] = clip_url(asset)
+            return urls[asset.filename]
+
+        results = []
+        for text, (sequence, cached) in zip(sentences, pipeline.translate_many(sentences)):
+            results.append({
+                'text': text,
+                'glosses': [{'word': word, 'clip': url(asset)} for word, asset in sequence],
+                'cached': cached
+            })
+        return jsonify({'success': True, 'results': results})
+    except Exception as e:
+        logger.error(f"Error in translate_api: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@text_to_sign_bp.route('/stats')
+def stats():
+    """Translation cache hit/miss counters and asset index size"""
+    return jsonify({**pipeline.stats(), 'assets': len(assets)})
 
 
 if __name__ == '__main__':
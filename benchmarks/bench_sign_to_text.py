@@ -0,0 +1,250 @@
+"""Stage-level benchmark for the sign-to-text pipeline.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_sign_to_text [--iterations N] [--json OUT] [--check BASELINE --tolerance 0.25]
+    python -m benchmarks.bench_sign_to_text --record VIDEO [--frames N]
+
+Runs on a CPU-only machine without a camera. Frames and landmark sets come
+from benchmarks/fixtures/sign_to_text.npz (written by --record from any
+video with a visible hand); without it, deterministic synthetic fixtures are
+used. Stages whose dependencies or model files are missing are reported as
+skipped rather than failing the run.
+"""
+import argparse
+import base64
+import json
+import logging
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'sign_to_text.npz')
+
+# Canonical right-hand landmark layout (frame pixels) used for synthetic fixtures
+HAND_TEMPLATE = np.array([
+    [320, 400], [290, 380], [270, 350], [255, 320], [245, 295],
+    [300, 300], [295, 260], [292, 235], [290, 215],
+    [325, 295], [325, 250], [325, 222], [325, 200],
+    [350, 300], [352, 260], [354, 235], [355, 215],
+    [372, 310], [378, 280], [382, 262], [385, 245],
+], dtype=np.float32)
+
+
+def synthetic_fixtures(n=32, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = rng.integers(0, 256, size=(n, 480, 640, 3), dtype=np.uint8)
+    landmarks = HAND_TEMPLATE[None] + rng.normal(0, 6, size=(n, 21, 2)).astype(np.float32)
+    landmarks = np.concatenate([landmarks, np.zeros((n, 21, 1), np.float32)], axis=2).astype(np.int32)
+    mins, maxs = landmarks[:, :, :2].min(axis=1), landmarks[:, :, :2].max(axis=1)
+    bboxes = np.concatenate([mins, maxs - mins], axis=1).astype(np.int32)
+    return frames, landmarks, bboxes
+
+
+def load_fixtures():
+    if os.path.exists(FIXTURE_PATH):
+        with np.load(FIXTURE_PATH) as data:
+            return data['frames'], data['landmarks'], data['bboxes'], 'recorded'
+    return (*synthetic_fixtures(), 'synthetic')
+
+
+def record_fixtures(video, max_frames):
+    """Grab frames with a detected hand from a video and store them as fixtures."""
+    from cvzone.HandTrackingModule import HandDetector
+
+    hd = HandDetector(maxHands=1, detectionCon=0.7)
+    cap = cv2.VideoCapture(video)
+    frames, landmarks, bboxes = [], [], []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame = cv2.resize(cv2.flip(frame, 1), (640, int(640 * frame.shape[0] / frame.shape[1])))
+        hands = hd.findHands(np.array(frame), draw=False, flipType=True)
+        if hands and hands[0]:
+            frames.append(frame)
+            landmarks.append(hands[0][0]['lmList'])
+            bboxes.append(hands[0][0]['bbox'])
+    cap.release()
+    if not frames:
+        raise SystemExit(f"No hands found in {video}")
+    os.makedirs(os.path.dirname(FIXTURE_PATH), exist_ok=True)
+    np.savez_compressed(FIXTURE_PATH, frames=np.stack(frames), landmarks=np.asarray(landmarks, np.int32),
+                        bboxes=np.asarray(bboxes, np.int32))
+    print(f"Saved {len(frames)} fixture frames to {FIXTURE_PATH}")
+
+
+class Bench:
+    def __init__(self, iterations):
+        self.iterations = iterations
+        self.results = {}
+
+    def run(self, name, fn, inputs):
+        """Time fn over the fixture inputs (cycled), after one untimed warm-up call."""
+        try:
+            fn(inputs[0])
+        except Exception as e:
+            self.results[name] = {'skipped': str(e)}
+            return
+        times = np.empty(self.iterations)
+        for i in range(self.iterations):
+            item = inputs[i % len(inputs)]
+            start = time.perf_counter()
+            fn(item)
+            times[i] = time.perf_counter() - start
+        ms = times * 1000
+        self.results[name] = {
+            'mean_ms': round(float(ms.mean()), 4),
+            'p50_ms': round(float(np.percentile(ms, 50)), 4),
+            'p90_ms': round(float(np.percentile(ms, 90)), 4),
+            'p99_ms': round(float(np.percentile(ms, 99)), 4),
+            'per_sec': round(float(1.0 / times.mean()), 1),
+        }
+
+    def report(self, source):
+        print(f"Fixtures: {source}, {self.iterations} iterations per stage")
+        print(f"{'stage':<22}{'mean ms':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'/sec':>10}")
+        for name, r in self.results.items():
+            if 'skipped' in r:
+                print(f"{name:<22}  skipped: {r['skipped']}")
+            else:
+                print(f"{name:<22}{r['mean_ms']:>10.3f}{r['p50_ms']:>10.3f}{r['p90_ms']:>10.3f}"
+                      f"{r['p99_ms']:>10.3f}{r['per_sec']:>10.1f}")
+        frame_ms = sum(r['mean_ms'] for name, r in self.results.items()
+                       if 'skipped' not in r and name in PER_FRAME_STAGES)
+        if frame_ms:
+            print(f"Estimated pipeline throughput: {1000.0 / frame_ms:.1f} frames/sec ({frame_ms:.2f} ms/frame)")
+
+
+# Stages that make up the default per-frame path (CNN classifier, no second pass; crop_canvas includes mapping)
+PER_FRAME_STAGES = ['flip_resize', 'detect_hands', 'crop_canvas', 'draw_keypoints',
+                    'model_predict', 'rule_cascade', 'smoothing_update', 'encode_jpeg_base64']
+
+
+def crop_canvas(frame, bbox, offset=20):
+    x, y, w, h = bbox
+    pad = max(20, int(min(w, h) * 0.2))
+    y1, y2 = max(0, y - offset - pad), min(frame.shape[0], y + h + offset + pad)
+    x1, x2 = max(0, x - offset - pad), min(frame.shape[1], x + w + offset + pad)
+    img_h, img_w = y2 - y1, x2 - x1
+    scale = 200.0 / max(img_h, img_w)
+    new_h, new_w = int(img_h * scale), int(img_w * scale)
+    white = np.ones((400, 400, 3), dtype=np.uint8) * 255
+    start_y, start_x = (400 - new_h) // 2, (400 - new_w) // 2
+    white[start_y:start_y + new_h, start_x:start_x + new_w] = cv2.resize(frame[y1:y2, x1:x2], (new_w, new_h))
+    return white, (x1, y1, scale, start_x, start_y)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sign-to-text pipeline stages")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--json', help="Write results as JSON to this path")
+    parser.add_argument('--check', help="Baseline JSON to compare p50 latencies against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed p50 regression vs baseline (fraction)")
+    parser.add_argument('--record', help="Record fixtures from this video instead of benchmarking")
+    parser.add_argument('--frames', type=int, default=64, help="Fixture frames to record")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.record:
+        record_fixtures(args.record, args.frames)
+        return 0
+
+    from app.config import Config
+    from app.sign_to_text.canvas import hand_canvas, map_to_canvas, draw_keypoints
+    from app.sign_to_text.rules import classify_symbol
+    from app.sign_to_text.preview import PreviewEncoder
+    from app.sign_to_text.smoothing import SymbolSmoother, SYMBOLS
+    from app.sign_to_text.tracking import HandTracker
+
+    frames, landmarks, bboxes, source = load_fixtures()
+    raw = [cv2.flip(f, 1) for f in frames]
+    canvases = [crop_canvas(f, b) for f, b in zip(frames, bboxes)]
+    bench = Bench(args.iterations)
+
+    settings = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+    try:
+        from app.sign_to_text.detector import DetectorResources
+        resources = DetectorResources(settings)
+    except (Exception, SystemExit) as e:
+        # Missing model files or detector dependencies; older loaders exited the process instead of raising
+        resources = None
+        logging.warning(f"Detector resources unavailable, model stages skipped: {e!r}")
+
+    # Resize to the frame size the rest of the pipeline sees (640 wide, the fixture's aspect ratio)
+    size = (frames.shape[2], frames.shape[1])
+    bench.run('flip_resize', lambda f: cv2.resize(cv2.flip(f, 1), size), raw)
+    if resources is not None and resources.hd is not None:
+        bench.run('detect_hands', lambda f: resources.hd.findHands(np.array(f), draw=False, flipType=True), list(frames))
+    if resources is not None and resources.hand_tracking:
+        tracker = HandTracker()
+        # What a session uses: the shared static graph for uploads, its own video-mode graph for the camera
+        hd_roi = resources.roi_detector()
+
+        def detect_roi(fb):
+            tracker.bbox = tuple(int(v) for v in fb[1])
+            return tracker.detect(hd_roi, fb[0], tracker.predict_roi(fb[0].shape))
+        bench.run('detect_roi', detect_roi, list(zip(frames, bboxes)))
+    bench.run('crop_canvas', lambda flb: hand_canvas(*flb), list(zip(frames, bboxes, landmarks)))
+    if resources is not None and resources.hd2 is not None:
+        bench.run('second_detect', lambda c: resources.hd2.findHands(c[0], draw=False, flipType=True), canvases)
+    bench.run('map_landmarks', lambda lc: map_to_canvas(lc[0], *lc[1][1]), list(zip(landmarks, canvases)))
+
+    canvas_pts = [map_to_canvas(lm, *c[1]) for lm, c in zip(landmarks, canvases)]
+    bench.run('draw_keypoints', lambda cp: draw_keypoints(cp[0][0].copy(), cp[1]), list(zip(canvases, canvas_pts)))
+
+    if resources is not None and resources.backend is not None:
+        bench.run('model_predict', lambda c: resources.backend.predict(c[0][None]), canvases)
+        # Two hands of one frame in a single call (SIGN_MAX_HANDS=2)
+        pairs_x2 = [np.stack([canvases[i][0], canvases[(i + 1) % len(canvases)][0]]) for i in range(len(canvases))]
+        bench.run('model_predict_x2', lambda b: resources.backend.predict(b), pairs_x2)
+        batch = np.stack([c[0] for c in canvases[:8]])
+        bench.run('model_predict_x8', lambda b: resources.backend.predict(b), [batch])
+    if resources is not None and resources.classifier == 'landmarks':
+        bench.run('landmark_classifier', lambda pts: resources.landmark_model.predict_landmarks([pts]), canvas_pts)
+
+    rng = np.random.default_rng(1)
+    pairs = [tuple(int(v) for v in rng.choice(8, 2, replace=False)) for _ in range(64)]
+    bench.run('rule_cascade', lambda i: classify_symbol(pairs[i % len(pairs)][0], pairs[i % len(pairs)][1],
+                                                        canvas_pts[i % len(canvas_pts)]),
+              list(range(len(pairs))))
+
+    smoother = SymbolSmoother(window=settings['SIGN_SMOOTHING_WINDOW'], mode=settings['SIGN_SMOOTHING_MODE'],
+                              hold=settings['SIGN_AUTOCOMMIT_FRAMES'])
+    symbols = [SYMBOLS[i % len(SYMBOLS)] for i in range(64)]
+    bench.run('smoothing_update', lambda sym: smoother.update(sym, 0.9), symbols)
+
+    if resources is not None:
+        words = ['HELO', 'WORL', 'THNK', 'SIGN', 'LANGUAG', 'GOD', 'MORNIN', 'PLEAS']
+        bench.run('enchant_suggest', lambda w: resources.dictionary.suggest(w), words)
+        bench.run('suggestions_cached', lambda w: resources.suggestions.suggest(w), words)
+
+    bench.run('encode_jpeg_base64', lambda f: base64.b64encode(
+        cv2.imencode('.jpg', f, [cv2.IMWRITE_JPEG_QUALITY, 85])[1]).decode('utf-8'), raw)
+    for tier in ('low', 'medium'):
+        # Distinct fixture frames, so unchanged-frame suppression never kicks in here
+        encoder = PreviewEncoder(settings['SIGN_PREVIEW_TIERS'], tier)
+        bench.run(f'encode_preview_{tier}', encoder.encode, raw)
+
+    bench.report(source)
+    if args.json:
+        with open(args.json, 'w') as out:
+            json.dump({'fixtures': source, 'iterations': args.iterations, 'stages': bench.results}, out, indent=2)
+
+    if args.check:
+        with open(args.check) as f:
+            baseline = json.load(f)['stages']
+        failed = []
+        for name, r in bench.results.items():
+            base = baseline.get(name, {})
+            if 'p50_ms' in r and 'p50_ms' in base and r['p50_ms'] > base['p50_ms'] * (1 + args.tolerance):
+                failed.append(f"{name}: p50 {r['p50_ms']:.3f}ms vs baseline {base['p50_ms']:.3f}ms")
+        if failed:
+            print("Regressions beyond tolerance:\n  " + "\n  ".join(failed))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
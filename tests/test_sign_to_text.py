@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+# The detector module imports the hand detector and dictionary at the top
+pytest.importorskip('cvzone')
+pytest.importorskip('enchant')
+
+from app.sign_to_text import detector as detector_module
+from app.sign_to_text.detector import ReplayResources, SignLanguageDetector, load_settings
+from app.sign_to_text.pipeline import Observation
+
+
+def feed(detector, monkeypatch, symbols):
+    """Run one observation per symbol through the session, with the rules returning that symbol."""
+    resources = detector.resources
+    pts = [[0, 0, 0]] * 21
+    prob = np.eye(8, dtype=np.float32)[0]
+    for symbol in symbols:
+        monkeypatch.setattr(detector_module, 'classify_symbol', lambda ch1, ch2, pts, symbol=symbol: symbol)
+        detector._update(Observation(True, pts, prob), resources.metrics)
+
+
+def test_next_commits_space_gesture(monkeypatch):
+    detector = SignLanguageDetector(ReplayResources(load_settings()))
+    window = detector.resources.smoothing['window']
+
+    feed(detector, monkeypatch, ['A'] * window + ['next'])
+    assert detector.str == " A"
+
+    feed(detector, monkeypatch, [' '] * window + ['next'])
+    assert detector.str == " A "